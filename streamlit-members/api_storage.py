@@ -0,0 +1,274 @@
+"""Portal storage served by backend_api over HTTP.
+
+The process-wide ``APIStorage`` owns the pooled ``BackendClient``. Each
+Streamlit session works through ``for_session(token)``, a shallow copy that
+carries the session's bearer token and shares the client, its response cache
+and the table versions, so the portal holds no dataset of its own.
+"""
+import base64
+import copy
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend_client import BackendClient, BackendError
+from member_directory import ALL, DEFAULT_PAGE_SIZE
+from storage import PortalStorage
+
+# JSON carries these as ISO strings; pages expect datetimes
+DATETIME_FIELDS = {
+    "created_at", "last_login", "submitted_at", "reviewed_at", "updated_at", "event_date",
+    "registered_at", "joined_at", "posted_date", "application_deadline", "assigned_at", "timestamp",
+    "applied_at",
+}
+USER_UPDATE_FIELDS = ("first_name", "last_name", "phone")
+PROFILE_UPDATE_FIELDS = ("bio", "linkedin_url", "experience_level", "specializations",
+                         "portfolio_projects", "is_public")
+
+
+def parse_row(row: Optional[Dict]) -> Optional[Dict]:
+    """Copy of an API row with its timestamp fields as datetimes"""
+    if row is None:
+        return None
+    parsed = dict(row)
+    for field in DATETIME_FIELDS.intersection(parsed):
+        if isinstance(parsed[field], str):
+            parsed[field] = datetime.fromisoformat(parsed[field])
+    return parsed
+
+
+def token_claims(token: Optional[str]) -> Dict[str, Any]:
+    """Unverified JWT payload; only used for cache scoping and expiry checks"""
+    if not token:
+        return {}
+    try:
+        payload = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return {}
+
+
+class APIStorage(PortalStorage):
+    def __init__(self, client: BackendClient):
+        super().__init__()
+        self.client = client
+        self.token: Optional[str] = None
+        self.claims: Dict[str, Any] = {}
+
+    def _get(self, path: str, **params) -> Any:
+        return self.client.get(path, self.token, params=params or None)
+
+    def _write(self, method: str, path: str, *tables: str, **kwargs) -> Any:
+        try:
+            return self.client.request(method, path, self.token, **kwargs)
+        finally:
+            self._touch(*tables)
+
+    # Sessions
+    def authenticate(self, email: str, password: str) -> Optional[Dict]:
+        """The login endpoint checks the password and records last_login"""
+        try:
+            token = self.client.login(email.strip(), password)
+        except BackendError as e:
+            if e.status_code == 401:
+                return None
+            raise
+        me = self.client.get("/api/me", token, ttl=0)
+        return {"user_id": me["user"]["user_id"], "token": token}
+
+    def for_session(self, token: Optional[str]) -> "APIStorage":
+        view = copy.copy(self)
+        view.token = token
+        view.claims = token_claims(token)
+        return view
+
+    def session_expired(self) -> bool:
+        return self.token is not None and self.claims.get("exp", 0) <= time.time()
+
+    def table_version(self, *tables: str) -> Tuple:
+        # The API filters by access level, so cached page data is also keyed by the caller's roles
+        return super().table_version(*tables) + (tuple(self.claims.get("roles", ())),)
+
+    # Users and membership: the session's own account from /api/me, anyone else's
+    # from /api/members/{id} (the public view unless the session is an admin)
+    def _member_part(self, user_id: int, part: str) -> Optional[Dict]:
+        if user_id == self.claims.get("uid"):
+            member = self._get("/api/me")
+        else:
+            try:
+                member = self._get(f"/api/members/{user_id}")
+            except BackendError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+        return parse_row(member.get(part))
+
+    def get_user(self, user_id: int) -> Optional[Dict]:
+        return self._member_part(user_id, "user")
+
+    def get_user_id_by_email(self, email: str) -> Optional[int]:
+        raise NotImplementedError("Accounts are looked up by the backend; use authenticate()")
+
+    def verify_password(self, user_id: int, password: str) -> bool:
+        raise NotImplementedError("Passwords are checked by the backend; use authenticate()")
+
+    def add_user(self, user: Dict) -> int:
+        raise NotImplementedError("Accounts are created through POST /api/auth/register")
+
+    def update_user(self, user_id: int, **changes):
+        # The API only lets a session edit its own account; last_login is set at login
+        values = {k: v for k, v in changes.items() if k in USER_UPDATE_FIELDS}
+        if values:
+            self._write("PATCH", "/api/me", "users", json=values)
+
+    def get_profile(self, user_id: int) -> Optional[Dict]:
+        return self._member_part(user_id, "profile")
+
+    def get_application(self, user_id: int) -> Optional[Dict]:
+        return self._member_part(user_id, "application")
+
+    def get_role(self, user_id: int) -> Optional[Dict]:
+        return self._member_part(user_id, "role")
+
+    def save_profile(self, profile: Dict) -> Dict:
+        values = {k: v for k, v in profile.items() if k in PROFILE_UPDATE_FIELDS}
+        return self._write("PUT", "/api/me/profile", "member_profiles", json=values)
+
+    def save_application(self, application: Dict) -> Dict:
+        self._write("POST", "/api/applications/submit", "member_applications", json={
+            k: application.get(k) for k in
+            ("graduation_year", "major", "career_interests", "interest_reason", "experience", "goals")
+        })
+        return application
+
+    def assign_role(self, user_id: int, role_name: str, permissions: List[str]) -> Dict:
+        raise NotImplementedError("Roles are managed on the backend")
+
+    def list_members(self) -> List[Dict]:
+        return [
+            {
+                "user_id": m["user_id"],
+                "user": parse_row(m["user"]),
+                "profile": parse_row(m["profile"]),
+                "application": parse_row(m["application"]),
+                "role": m["role"],
+            }
+            for m in self._get("/api/members")
+        ]
+
+    def list_public_members(self) -> List[Dict]:
+        return self._get("/api/members/public")
+
+    def count_alumni_collaborations(self) -> int:
+        return self._get("/api/alumni/collaborations/count")["count"]
+
+    def collaboration_types(self, user_id: int) -> List[str]:
+        raise NotImplementedError("Offers are matched on the backend; use match_members()")
+
+    def match_members(self, alumni_id: int, collaboration_type: str = "mentorship") -> List[Dict]:
+        return self._get("/api/alumni/matches", collaboration_type=collaboration_type)
+
+    # Member Directory: filtered, sorted and paged by the backend's index
+    def directory_page(self, name_search: str = "", class_year: str = ALL, specialization: str = ALL,
+                       sort_by: str = "Name", page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        result = dict(self._get("/api/directory", q=name_search, class_year=class_year,
+                                specialization=specialization, sort=sort_by, page=page, page_size=page_size))
+        result["items"] = [
+            {**member, "user": parse_row(member["user"]), "profile": parse_row(member["profile"]),
+             "application": parse_row(member["application"])}
+            for member in result["items"]
+        ]
+        return result
+
+    # Content
+    def list_resources(self) -> List[Dict]:
+        items, cursor = [], None
+        while True:
+            page = self._get("/api/resources", limit=200, **({"cursor": cursor} if cursor else {}))
+            items.extend(parse_row(item) for item in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return sorted(items, key=lambda r: r["resource_id"])
+
+    def list_events(self) -> List[Dict]:
+        return [parse_row(event) for event in self._get("/api/events")]
+
+    def list_job_postings(self) -> List[Dict]:
+        return [parse_row(job) for job in self._get("/api/jobs")]
+
+    def search(self, query: str, doc_type: str) -> List[int]:
+        # Ranked by the backend's full-text index rather than one built in the portal
+        if not query.strip():
+            return []
+        return [hit["id"] for hit in self._get("/api/search", q=query.strip()[:200], types=doc_type, limit=100)["results"]]
+
+    # Job applications
+    def apply_for_job(self, job_id: int, user_id: int) -> Optional[Dict]:
+        try:
+            return parse_row(self._write("POST", f"/api/jobs/{job_id}/apply", "job_applications", "job_postings"))
+        except BackendError as e:
+            if e.status_code in (400, 404):
+                return None
+            raise
+
+    def get_job_applications(self, user_id: int) -> List[Dict]:
+        return [parse_row(application) for application in self._get("/api/jobs/applications/me")]
+
+    def get_received_applications(self, poster_id: int) -> List[Dict]:
+        return [parse_row(application) for application in self._get("/api/jobs/applications/received")]
+
+    # Messaging and networking
+    def inbox_page(self, user_id: int, limit: int = 20, cursor: Optional[int] = None,
+                   unread_only: bool = False) -> Dict:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if unread_only:
+            params["unread_only"] = "true"
+        page = self._get("/api/messages", **params)
+        return {"items": [parse_row(message) for message in page["items"]], "next_cursor": page["next_cursor"]}
+
+    def unread_count(self, user_id: int) -> int:
+        return self._get("/api/messages/unread-count")["unread"]
+
+    def send_message(self, from_user: int, to_user: int, subject: str, body: str) -> int:
+        return self._write("POST", "/api/messages", "messages",
+                           json={"to_user": to_user, "subject": subject, "message": body})["message_id"]
+
+    def mark_messages_read(self, user_id: int, message_ids: Optional[List[int]] = None) -> int:
+        return self._write("POST", "/api/messages/read", "messages", json={"message_ids": message_ids})["marked"]
+
+    def get_connections(self, user_id: int) -> List[int]:
+        return list(self._get("/api/connections"))
+
+    def connection_counts(self) -> Dict[int, int]:
+        raise NotImplementedError("Connection counts stay on the backend; use directory_page()")
+
+    # Event registration and waitlists
+    def register_for_event(self, event_id: int, user_id: int) -> bool:
+        try:
+            self._write("POST", f"/api/events/{event_id}/register", "events")
+        except BackendError as e:
+            if e.status_code == 400 and e.detail == "Already registered":
+                return True
+            if e.status_code in (400, 404):
+                return False
+            raise
+        return True
+
+    def join_waitlist(self, event_id: int, user_id: int) -> int:
+        try:
+            return self._write("POST", f"/api/events/{event_id}/waitlist", "event_waitlist")["position"]
+        except BackendError as e:
+            if e.status_code == 400 and e.detail == "Already on the waitlist":
+                return self.waitlist_position(event_id, user_id)
+            raise
+
+    def waitlist_position(self, event_id: int, user_id: int) -> Optional[int]:
+        try:
+            return self._get(f"/api/events/{event_id}/waitlist/me")["position"]
+        except BackendError as e:
+            if e.status_code == 404:
+                return None
+            raise
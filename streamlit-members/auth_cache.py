@@ -0,0 +1,139 @@
+"""Resolved-principal cache for token authentication."""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+ALL_PERMISSIONS = "all"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user as seen by request handlers"""
+    user_id: int
+    email: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    status: Optional[str]
+    roles: Tuple[str, ...] = field(default_factory=tuple)
+    permissions: Tuple[str, ...] = field(default_factory=tuple)
+
+    def has_role(self, role_name: str) -> bool:
+        return role_name in self.roles
+
+    def has_permission(self, permission: str) -> bool:
+        return ALL_PERMISSIONS in self.permissions or permission in self.permissions
+
+
+def merge_permissions(grants: Iterable[Any]) -> Tuple[str, ...]:
+    """Union the permissions JSON of several UserRole rows.
+
+    Each grant is either a list of permission names or a {name: bool} mapping.
+    """
+    merged = set()
+    for grant in grants:
+        if isinstance(grant, dict):
+            merged.update(name for name, allowed in grant.items() if allowed)
+        elif grant:
+            merged.update(grant)
+    return tuple(sorted(merged))
+
+
+class PrincipalCache:
+    """TTL + LRU cache of principals keyed by token subject"""
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 10000,
+                 token_lifetime_seconds: float = 1800):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.token_lifetime_seconds = token_lifetime_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._subjects_by_user: Dict[int, str] = {}
+        # Oldest first; an entry outlives every token issued before it after one token lifetime
+        self._invalidated_at: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, subject: str) -> Optional[Principal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or now - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    self._drop(subject)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, subject: str, principal: Principal):
+        with self._lock:
+            self._entries[subject] = (time.monotonic(), principal)
+            self._entries.move_to_end(subject)
+            self._subjects_by_user[principal.user_id] = subject
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int):
+        """Drop a user's cached principal and distrust token claims issued before now"""
+        now = time.time()
+        with self._lock:
+            self._invalidated_at[user_id] = now
+            self._invalidated_at.move_to_end(user_id)
+            while next(iter(self._invalidated_at.values())) < now - self.token_lifetime_seconds:
+                self._invalidated_at.popitem(last=False)
+            subject = self._subjects_by_user.pop(user_id, None)
+            if subject is not None:
+                self._entries.pop(subject, None)
+
+    def claims_trusted(self, user_id: int, issued_at: Optional[float]) -> bool:
+        with self._lock:
+            invalidated_at = self._invalidated_at.get(user_id)
+        if invalidated_at is None:
+            return True
+        return issued_at is not None and issued_at > invalidated_at
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._subjects_by_user.clear()
+
+    def _drop(self, subject: str):
+        entry = self._entries.pop(subject, None)
+        if entry is not None and self._subjects_by_user.get(entry[1].user_id) == subject:
+            del self._subjects_by_user[entry[1].user_id]
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "invalidated_users": len(self._invalidated_at)}
+
+
+def principal_from_claims(payload: dict) -> Optional[Principal]:
+    """Build a principal from uid/roles/name claims, if the token carries them"""
+    if "uid" not in payload or "roles" not in payload:
+        return None
+    first_name, last_name = (payload.get("name") or [None, None])[:2]
+    return Principal(
+        user_id=payload["uid"],
+        email=payload["sub"],
+        first_name=first_name,
+        last_name=last_name,
+        status=payload.get("status"),
+        roles=tuple(payload["roles"]),
+        permissions=tuple(payload.get("perms", ())),
+    )
+
+
+def principal_claims(principal: Principal) -> dict:
+    return {
+        "sub": principal.email,
+        "uid": principal.user_id,
+        "roles": list(principal.roles),
+        "perms": list(principal.permissions),
+        "name": [principal.first_name, principal.last_name],
+        "status": principal.status,
+    }
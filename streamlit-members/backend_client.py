@@ -0,0 +1,139 @@
+"""Pooled HTTP client for backend_api.
+
+One ``httpx.Client`` per portal process keeps connections alive across every
+Streamlit session. GET responses are cached for a few seconds per
+(path, params, token), and identical GETs that arrive while one is already in
+flight wait for its response instead of sending their own. Any write clears
+the cache, since it may change what other sessions read.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+
+class BackendError(Exception):
+    """Non-2xx response from the backend"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class BackendClient:
+    def __init__(self, base_url: str, max_keepalive: int = 5, max_connections: int = 15,
+                 cache_ttl: float = 5.0, timeout: float = 10.0, max_cache_entries: int = 1000,
+                 transport: Optional[httpx.BaseTransport] = None):
+        self.http = httpx.Client(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive),
+            transport=transport
+        )
+        self.cache_ttl = cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    @staticmethod
+    def _key(path: str, params: Optional[Dict[str, Any]], token: Optional[str]) -> Hashable:
+        frozen = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in (params or {}).items()
+        ))
+        return (path, frozen, token)
+
+    def _send(self, method: str, path: str, token: Optional[str], **kwargs) -> Any:
+        with self._lock:
+            self.requests += 1
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        response = self.http.request(method, path, headers=headers, **kwargs)
+        if response.status_code >= 400:
+            with self._lock:
+                self.errors += 1
+            try:
+                detail = response.json().get("detail", response.text)
+            except ValueError:
+                detail = response.text
+            raise BackendError(response.status_code, str(detail))
+        return response.json() if response.content else None
+
+    def get(self, path: str, token: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+            ttl: Optional[float] = None) -> Any:
+        """Cached, coalesced GET; callers must treat the result as read-only"""
+        ttl = self.cache_ttl if ttl is None else ttl
+        key = self._key(path, params, token)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.cache_hits += 1
+                return cached[1]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            data = self._send("GET", path, token, params=params)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if ttl > 0:
+                if len(self._cache) >= self.max_cache_entries:
+                    self._prune()
+                self._cache[key] = (time.monotonic() + ttl, data)
+            self._inflight.pop(key, None)
+        future.set_result(data)
+        return data
+
+    def request(self, method: str, path: str, token: Optional[str] = None, **kwargs) -> Any:
+        """Uncached request (POST/PUT/PATCH/DELETE); drops every cached GET"""
+        try:
+            return self._send(method, path, token, **kwargs)
+        finally:
+            self.invalidate()
+
+    def login(self, email: str, password: str) -> str:
+        """Exchange credentials for a bearer token"""
+        data = self._send("POST", "/api/auth/login", None, data={"username": email, "password": password})
+        return data["access_token"]
+
+    def invalidate(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+            del self._cache[key]
+        while len(self._cache) >= self.max_cache_entries:
+            self._cache.pop(next(iter(self._cache)))
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "cache_hits": self.cache_hits,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "cached": len(self._cache),
+                "in_flight": len(self._inflight),
+            }
+
+    def close(self):
+        self.http.close()
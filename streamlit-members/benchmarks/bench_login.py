@@ -0,0 +1,88 @@
+"""Login throughput under concurrent load, with bcrypt inline vs. on the hash pool.
+
+    python benchmarks/bench_login.py --requests 64 --concurrency 8
+
+Each mode runs in a fresh subprocess against a throwaway SQLite database.
+Alongside the logins it samples event-loop lag to show how long other requests stall.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+async def run(requests: int, concurrency: int):
+    sys.path.insert(0, os.path.dirname(HERE))
+    import httpx
+    import backend_api
+
+    transport = httpx.ASGITransport(app=backend_api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/auth/register", json={
+            "email": "bench@usc.edu", "password": "bench123",
+            "first_name": "Bench", "last_name": "User"
+        })
+
+        semaphore = asyncio.Semaphore(concurrency)
+        done = asyncio.Event()
+        loop_lag = []
+
+        async def login():
+            async with semaphore:
+                r = await client.post("/api/auth/login", data={"username": "bench@usc.edu", "password": "bench123"})
+                r.raise_for_status()
+
+        async def sample_loop_lag():
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                loop_lag.append(time.perf_counter() - start - 0.01)
+
+        sampler = asyncio.create_task(sample_loop_lag())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await sampler
+
+    worst = max(loop_lag) * 1000 if loop_lag else 0.0
+    print(f"workers={backend_api.PASSWORD_HASH_WORKERS:<3} logins={requests} "
+          f"elapsed={elapsed:.2f}s throughput={requests / elapsed:.1f}/s "
+          f"loop_lag_max={worst:.0f}ms metrics={backend_api.password_hasher.metrics()}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 4])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(run(args.requests, args.concurrency))
+        return
+
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                PASSWORD_HASH_WORKERS=str(workers),
+                EMAIL_BACKEND="file",
+                EMAIL_FILE_PATH=os.path.join(tmp, "outbox"),
+            )
+            subprocess.run(
+                [sys.executable, __file__, "--child",
+                 "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+                env=env, check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Portal startup and rerun timings, and when pandas/plotly get imported.
+
+    python benchmarks/bench_portal_reruns.py --role admin --reruns 20
+    python benchmarks/bench_portal_reruns.py --app /path/to/other/checkout/app.py
+
+Each app file runs in a fresh subprocess under Streamlit's AppTest: the cold
+first run (login page), warm login-page reruns, signing in, then every page
+of the role's navigation (first visit and a warm rerun). Each line shows which
+heavy libraries are loaded by then. Pass several --app paths to compare checkouts.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY = ("pandas", "plotly.express", "pyarrow")
+ACCOUNTS = {
+    "admin": ("admin@usc.edu", "admin123"),
+    "member": ("member@usc.edu", "member123"),
+    "alumni": ("alumni@company.com", "alumni123"),
+}
+
+
+def run(app: str, role: str, reruns: int):
+    import logging
+    import warnings
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.ERROR)  # page errors are reported inline below
+    sys.path.insert(0, os.path.dirname(os.path.abspath(app)))
+    from streamlit.testing.v1 import AppTest
+
+    def timed(label: str, step):
+        start = time.perf_counter()
+        step()
+        elapsed = (time.perf_counter() - start) * 1000
+        loaded = ",".join(name for name in HEAVY if name in sys.modules) or "-"
+        error = f"  error={at.exception[0].message[:60]!r}" if at.exception else ""
+        print(f"  {label:<34} {elapsed:8.1f}ms  loaded={loaded}{error}")
+        return elapsed
+
+    at = AppTest.from_file(app, default_timeout=120)
+    print(f"{app} ({role})")
+    timed("startup (login page)", at.run)
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {'login page rerun (median/max)':<34} {statistics.median(samples):8.1f}ms / {max(samples):.1f}ms")
+
+    email, password = ACCOUNTS[role]
+    at.text_input[0].input(email)
+    at.text_input[1].input(password)
+    at.button[0].click()
+    timed("sign in", at.run)
+    timed("landing page", at.run)
+
+    for page in at.sidebar.selectbox[0].options:
+        at.sidebar.selectbox[0].set_value(page)
+        timed(f"open {page}", at.run)
+        timed(f"rerun {page}", at.run)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", nargs="+", default=[os.path.join(os.path.dirname(HERE), "app.py")])
+    parser.add_argument("--role", choices=sorted(ACCOUNTS), default="member")
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run(args.app[0], args.role, args.reruns)
+        return
+
+    for app in args.app:
+        subprocess.run(
+            [sys.executable, __file__, "--child", "--app", app, "--role", args.role, "--reruns", str(args.reruns)],
+            cwd=os.path.dirname(os.path.abspath(app)), check=True
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Concurrent sign-ups against a capped event must never overbook it.
+
+    python benchmarks/load_event_registration.py --users 500 --capacity 50 --cancel 10
+
+Everyone turned away joins the waitlist concurrently; then --cancel seats are
+released at once and must be refilled from the head of the waitlist.
+
+Uses DATABASE_URL when set (point it at Postgres for a realistic run),
+otherwise a throwaway SQLite file. Exits non-zero on overbooking.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+async def run(users: int, capacity: int, concurrency: int, cancel: int) -> bool:
+    sys.path.insert(0, os.path.dirname(HERE))
+    import httpx
+    from sqlalchemy import func, select
+    import backend_api as api
+
+    with api.SessionLocal() as session:
+        event = api.Event(title="Load Test Recruiting Night", event_date=datetime.utcnow() + timedelta(days=7),
+                          max_attendees=capacity)
+        session.add(event)
+        batch = [api.User(email=f"load{i}-{time.time_ns()}@usc.edu", first_name="Load", last_name=str(i),
+                          password_hash="x", status="active") for i in range(users)]
+        session.add_all(batch)
+        session.commit()
+        event_id = event.event_id
+        tokens = [api.create_access_token({"sub": u.email}, timedelta(minutes=30)) for u in batch]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load", timeout=60) as client:
+        async def call(method, path, token):
+            async with semaphore:
+                r = await client.request(method, f"/api/events/{event_id}/{path}",
+                                         headers={"Authorization": f"Bearer {token}"})
+                return r.status_code, r.json().get("detail", "ok")
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(call("POST", "register", t) for t in tokens))
+        elapsed = time.perf_counter() - start
+
+        registered_tokens = [t for t, (code, _) in zip(tokens, results) if code == 200]
+        turned_away = [t for t, (code, _) in zip(tokens, results) if code != 200]
+        start = time.perf_counter()
+        joined = await asyncio.gather(*(call("POST", "waitlist", t) for t in turned_away))
+        waitlist_elapsed = time.perf_counter() - start
+        cancelled = await asyncio.gather(*(call("DELETE", "register", t) for t in registered_tokens[:cancel]))
+
+    with api.SessionLocal() as session:
+        registered = session.scalar(select(func.count()).select_from(api.EventRegistration).where(
+            api.EventRegistration.event_id == event_id))
+        counter = session.get(api.Event, event_id).registered_count
+        waiting = session.scalar(select(func.count()).select_from(api.EventWaitlistEntry).where(
+            api.EventWaitlistEntry.event_id == event_id))
+        tickets = session.scalars(select(api.EventWaitlistEntry.ticket).where(
+            api.EventWaitlistEntry.event_id == event_id)).all()
+
+    api.mail_queue.stop()
+    expected = min(users, capacity)
+    promoted = min(len(cancelled), len(turned_away))
+    print(f"users={users} capacity={capacity} elapsed={elapsed:.2f}s "
+          f"responses={dict(Counter(results))} registrations={registered} counter={counter}")
+    print(f"waitlist joins={dict(Counter(joined))} in {waitlist_elapsed:.2f}s "
+          f"cancelled={dict(Counter(cancelled))} waiting={waiting}")
+    return (registered == counter == expected - len(cancelled) + promoted
+            and waiting == len(turned_away) - promoted
+            and len(set(tickets)) == len(tickets))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--capacity", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--cancel", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tmp, 'load.db')}")
+        os.environ.setdefault("EMAIL_BACKEND", "file")
+        os.environ.setdefault("EMAIL_FILE_PATH", os.path.join(tmp, "outbox"))
+        ok = asyncio.run(run(args.users, args.capacity, args.concurrency, args.cancel))
+
+    if not ok:
+        sys.exit("Overbooked, lost registrations or waitlist promotions")
+
+
+if __name__ == "__main__":
+    main()
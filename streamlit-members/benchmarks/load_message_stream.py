@@ -0,0 +1,196 @@
+"""Open message streams held by one API worker, and how fast pushes reach them.
+
+    python benchmarks/load_message_stream.py --connections 2000 --users 500 --messages 200
+
+Starts a single uvicorn worker, opens --connections Server-Sent Events streams
+spread over --users recipients, then sends --messages messages to random
+recipients and reads back one receipt per message. Reports connect time, the
+worker's RSS per open stream, and send-to-arrival latency across every tab the
+recipient has open. Exits non-zero if any push goes missing.
+
+Uses DATABASE_URL when set, otherwise a throwaway SQLite file. Raise the open
+file limit (ulimit -n) above --connections for large runs.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else float("nan")
+
+
+def seed_users(count: int):
+    sys.path.insert(0, os.path.dirname(HERE))
+    import backend_api as api
+
+    with api.SessionLocal() as session:
+        batch = [api.User(email=f"stream{i}-{time.time_ns()}@usc.edu", first_name="Stream", last_name=str(i),
+                          password_hash="x", status="active") for i in range(count + 1)]
+        session.add_all(batch)
+        session.flush()
+        # The sender also reads the admin-only /metrics
+        session.add(api.UserRole(user_id=batch[0].user_id, role_name="admin", permissions=[]))
+        session.commit()
+        users = [(u.user_id, api.create_access_token({"sub": u.email}, timedelta(minutes=30))) for u in batch]
+    api.mail_queue.stop()
+    return users[0], users[1:]  # (sender, recipients)
+
+
+async def run(base_url: str, server_pid: int, connections: int, users: int, messages: int, concurrency: int) -> bool:
+    import httpx
+
+    sender, recipients = seed_users(users)
+    arrivals = {}  # message_id -> arrival times, one per open tab of the recipient
+    receipts = asyncio.Event()
+    ready = 0
+    all_ready = asyncio.Event()
+
+    async def listen(client, user_id, token):
+        nonlocal ready
+        headers = {"Authorization": f"Bearer {token}"}
+        async with client.stream("GET", f"{base_url}/api/messages/stream", headers=headers) as response:
+            response.raise_for_status()
+            fields = {}
+            async for line in response.aiter_lines():
+                if line:
+                    name, _, value = line.partition(": ")
+                    fields[name] = value
+                    continue
+                event = fields.get("event")
+                if event == "message":
+                    arrivals.setdefault(int(fields["id"]), []).append(time.perf_counter())
+                elif event == "ready":
+                    ready += 1
+                    if ready == connections + 1:
+                        all_ready.set()
+                elif event == "read" and user_id == sender[0]:
+                    receipts.set()
+                fields = {}
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(60, read=None)) as streams, \
+            httpx.AsyncClient(timeout=60) as client:
+        tabs = [recipients[i % len(recipients)] for i in range(connections)]
+        baseline = rss_mb(server_pid)
+        start = time.perf_counter()
+        listeners = [asyncio.create_task(listen(streams, *sender))]
+        listeners += [asyncio.create_task(listen(streams, user_id, token)) for user_id, token in tabs]
+        await asyncio.wait_for(all_ready.wait(), 300)
+        connect_elapsed = time.perf_counter() - start
+        held = rss_mb(server_pid)
+
+        tabs_per_user = {}
+        for user_id, _ in tabs:
+            tabs_per_user[user_id] = tabs_per_user.get(user_id, 0) + 1
+        semaphore = asyncio.Semaphore(concurrency)
+        sent = {}  # message_id -> (send start, recipient)
+        sender_headers = {"Authorization": f"Bearer {sender[1]}"}
+
+        async def send(i):
+            user_id, _ = random.choice(tabs)
+            async with semaphore:
+                began = time.perf_counter()
+                r = await client.post(f"{base_url}/api/messages", headers=sender_headers,
+                                      json={"to_user": user_id, "subject": f"load {i}", "message": "ping"})
+                r.raise_for_status()
+                sent[r.json()["message_id"]] = (began, user_id)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send(i) for i in range(messages)))
+        send_elapsed = time.perf_counter() - start
+        deadline = time.perf_counter() + 10
+        expected = sum(tabs_per_user[user_id] for _, user_id in sent.values())
+        while sum(len(arrivals.get(message_id, ())) for message_id in sent) < expected and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+
+        # One recipient reads a message; the receipt must reach the sender's stream
+        message_id, (_, reader_id) = next(iter(sent.items()))
+        reader_token = dict(tabs)[reader_id]
+        await client.post(f"{base_url}/api/messages/{message_id}/read",
+                          headers={"Authorization": f"Bearer {reader_token}"})
+        try:
+            await asyncio.wait_for(receipts.wait(), 10)
+        except asyncio.TimeoutError:
+            pass
+        metrics = (await client.get(f"{base_url}/metrics", headers=sender_headers)).json()["message_stream"]
+
+        for listener in listeners:
+            listener.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+
+    latencies = [(arrived - sent[message_id][0]) * 1000
+                 for message_id in sent for arrived in arrivals.get(message_id, ())]
+    delivered = len(latencies)
+    per_stream_kb = (held - baseline) * 1024 / connections if connections else 0
+    print(f"streams={connections + 1} users={len(tabs_per_user)} connected in {connect_elapsed:.2f}s "
+          f"rss={baseline:.0f}MB->{held:.0f}MB (~{per_stream_kb:.1f}KB/stream)")
+    print(f"messages={messages} sent in {send_elapsed:.2f}s pushes delivered={delivered}/{expected} "
+          f"latency p50={percentile(latencies, 0.5):.1f}ms p95={percentile(latencies, 0.95):.1f}ms "
+          f"max={max(latencies, default=float('nan')):.1f}ms "
+          f"mean={statistics.fmean(latencies) if latencies else float('nan'):.1f}ms")
+    print(f"read receipt={'ok' if receipts.is_set() else 'missing'} server={metrics}")
+    return delivered == expected and receipts.is_set() and metrics["dropped"] == 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=250)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    if "DATABASE_URL" not in os.environ:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/load_messages.db"
+    os.environ.setdefault("EMAIL_BACKEND", "file")
+    os.environ.setdefault("EMAIL_FILE_PATH", tempfile.mkdtemp())
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend_api:app", "--port", str(args.port),
+         "--workers", "1", "--log-level", "warning"],
+        cwd=os.path.dirname(HERE)
+    )
+    try:
+        import httpx
+        base_url = f"http://127.0.0.1:{args.port}"
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.HTTPError:
+                time.sleep(0.2)
+        ok = asyncio.run(run(base_url, server.pid, args.connections, args.users, args.messages, args.concurrency))
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""In-process full-text search over resources, events and job postings.
+
+Used by the local portal storages; backend_api serves the same search from
+its database index (search.py) at /api/search. Terms map to weighted term
+frequencies per (doc_type, doc_id), titles and companies weigh most, and the
+last query token matches as a prefix over the sorted term list.
+"""
+import bisect
+import math
+import re
+from typing import Dict, List, Optional
+
+
+class ContentSearchIndex:
+    """Inverted index: term -> {(doc_type, doc_id): weighted term frequency}"""
+
+    FIELD_WEIGHTS = {'title': 3.0, 'company': 3.0, 'tags': 2.0}
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[tuple, float]] = {}
+        self.doc_terms: Dict[tuple, set] = {}
+        self.sorted_terms: List[str] = []
+
+    @classmethod
+    def build(cls, resources: List[Dict], events: List[Dict], job_postings: List[Dict]) -> "ContentSearchIndex":
+        index = cls()
+        for resource in resources:
+            index.add('resource', resource['resource_id'], {
+                'title': resource['title'], 'description': resource['description'], 'tags': resource.get('tags', [])
+            })
+        for event in events:
+            index.add('event', event['event_id'], {'title': event['title'], 'description': event['description']})
+        for job in job_postings:
+            index.add('job', job['job_id'], {
+                'title': job['title'], 'company': job['company'], 'description': job['description'],
+                'requirements': job['requirements'], 'location': job['location']
+            })
+        return index
+
+    @staticmethod
+    def tokenize(text) -> List[str]:
+        return re.findall(r"\w+", str(text or '').lower())
+
+    def add(self, doc_type: str, doc_id: int, fields: Dict[str, object]):
+        """Index (or re-index) one document"""
+        key = (doc_type, doc_id)
+        self.remove(doc_type, doc_id)
+        weights: Dict[str, float] = {}
+        for field, value in fields.items():
+            if isinstance(value, (list, tuple)):
+                value = ' '.join(map(str, value))
+            for term in self.tokenize(value):
+                weights[term] = weights.get(term, 0.0) + self.FIELD_WEIGHTS.get(field, 1.0)
+        for term, weight in weights.items():
+            if term not in self.postings:
+                bisect.insort(self.sorted_terms, term)
+                self.postings[term] = {}
+            self.postings[term][key] = weight
+        self.doc_terms[key] = set(weights)
+
+    def remove(self, doc_type: str, doc_id: int):
+        key = (doc_type, doc_id)
+        for term in self.doc_terms.pop(key, ()):
+            self.postings[term].pop(key, None)
+
+    def _expand(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.sorted_terms, prefix)
+        terms = []
+        for term in self.sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, doc_type: Optional[str] = None) -> List[tuple]:
+        """Ranked (doc_type, doc_id) keys; every token must match, the last one as a prefix"""
+        tokens = self.tokenize(query)
+        if not tokens:
+            return []
+        total = max(len(self.doc_terms), 1)
+        scores: Optional[Dict[tuple, float]] = None
+        for i, token in enumerate(tokens):
+            terms = self._expand(token) if i == len(tokens) - 1 else [token]
+            token_scores: Dict[tuple, float] = {}
+            for term in terms:
+                postings = self.postings.get(term, {})
+                idf = math.log(1 + total / (1 + len(postings)))
+                for key, weight in postings.items():
+                    if doc_type is None or key[0] == doc_type:
+                        token_scores[key] = token_scores.get(key, 0.0) + weight * idf
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: score + token_scores[key] for key, score in scores.items() if key in token_scores}
+            if not scores:
+                return []
+        return sorted(scores, key=scores.get, reverse=True)
@@ -0,0 +1,115 @@
+"""Buffered counters for hot rows.
+
+Increments land in lock-striped in-memory buckets and a background thread
+periodically hands the accumulated deltas to a flush function, so a burst of
+clicks on one row becomes a single ``SET n = n + delta`` write.
+"""
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class StripedCounter:
+    """Per-key pending deltas spread over independently locked stripes"""
+
+    def __init__(self, stripes: int = 16):
+        self._stripes: List[Tuple[threading.Lock, Dict[Hashable, int]]] = [
+            (threading.Lock(), {}) for _ in range(max(stripes, 1))
+        ]
+
+    def _stripe(self, key: Hashable) -> Tuple[threading.Lock, Dict[Hashable, int]]:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def add(self, key: Hashable, amount: int = 1):
+        lock, counts = self._stripe(key)
+        with lock:
+            counts[key] = counts.get(key, 0) + amount
+
+    def pending(self, key: Hashable) -> int:
+        lock, counts = self._stripe(key)
+        with lock:
+            return counts.get(key, 0)
+
+    def total_pending(self) -> int:
+        total = 0
+        for lock, counts in self._stripes:
+            with lock:
+                total += sum(counts.values())
+        return total
+
+    def drain(self) -> Dict[Hashable, int]:
+        """Take and reset every pending delta"""
+        drained: Dict[Hashable, int] = {}
+        for lock, counts in self._stripes:
+            with lock:
+                drained.update(counts)
+                counts.clear()
+        return {key: amount for key, amount in drained.items() if amount}
+
+    def restore(self, deltas: Dict[Hashable, int]):
+        """Put back deltas whose flush failed"""
+        for key, amount in deltas.items():
+            self.add(key, amount)
+
+
+class CounterFlusher:
+    """Flushes a StripedCounter every `interval` seconds on a daemon thread"""
+
+    def __init__(self, counter: StripedCounter, flush_fn: Callable[[Dict[Hashable, int]], None],
+                 interval: float = 2.0):
+        self.counter = counter
+        self.flush_fn = flush_fn
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self.flushes = 0
+        self.flushed = 0
+        self.failures = 0
+        self.last_flush_ms = 0.0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="counter-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the thread and write out whatever is still buffered"""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+        self.flush()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            deltas = self.counter.drain()
+            if not deltas:
+                return 0
+            start = time.perf_counter()
+            try:
+                self.flush_fn(deltas)
+            except Exception as e:
+                self.failures += 1
+                self.counter.restore(deltas)
+                print(f"Counter flush error: {e}")
+                return 0
+            self.flushes += 1
+            self.flushed += sum(deltas.values())
+            self.last_flush_ms = round((time.perf_counter() - start) * 1000, 3)
+            return len(deltas)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "pending": self.counter.total_pending(),
+            "flushes": self.flushes,
+            "flushed": self.flushed,
+            "failures": self.failures,
+            "last_flush_ms": self.last_flush_ms,
+        }
@@ -0,0 +1,129 @@
+"""Connection pool configuration and instrumentation for SQLAlchemy engines."""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMonitor:
+    """Counts checkouts, wait/hold times, timeouts and invalidations for one pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.engine: Optional[Engine] = None
+        self.connects = 0
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.invalidations = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+        self.checkins = 0
+
+    def record_wait(self, seconds: float, timed_out: bool):
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+                return
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def attach(self, engine: Engine):
+        """Register pool event listeners on a sync engine (or AsyncEngine.sync_engine)"""
+        self.engine = engine
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            connection_record.info["checked_out_at"] = time.perf_counter()
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            started = connection_record.info.pop("checked_out_at", None)
+            if started is None:
+                return
+            held = time.perf_counter() - started
+            with self._lock:
+                self.checkins += 1
+                self.hold_total += held
+                self.hold_max = max(self.hold_max, held)
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.engine.pool if self.engine is not None else None
+        stats: Dict[str, Any] = {"pool_class": type(pool).__name__ if pool else None}
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "timeout_seconds": pool.timeout(),
+            })
+        with self._lock:
+            stats.update({
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "invalidations": self.invalidations,
+                "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "hold_avg_ms": round(self.hold_total / self.checkins * 1000, 3) if self.checkins else 0.0,
+                "hold_max_ms": round(self.hold_max * 1000, 3),
+            })
+        return stats
+
+
+def instrumented_pool_class(base, monitor: PoolMonitor):
+    """Subclass a queue pool so time spent waiting for a connection is measured.
+
+    The monitor lives on the class, so pools rebuilt by ``Pool.recreate()``
+    after ``engine.dispose()`` keep reporting to it.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except exc.TimeoutError:
+            monitor.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        monitor.record_wait(time.perf_counter() - start, timed_out=False)
+        return conn
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def pool_options(url: str, monitor: PoolMonitor, size: int, max_overflow: int, timeout: int,
+                 recycle: int, pre_ping: bool, is_async: bool = False) -> Dict[str, Any]:
+    """create_engine kwargs for the configured pool; in-memory SQLite keeps its default pool"""
+    options: Dict[str, Any] = {"pool_pre_ping": pre_ping, "pool_recycle": recycle}
+    if _is_memory_sqlite(url):
+        return options
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    options.update({
+        "poolclass": instrumented_pool_class(base, monitor),
+        "pool_size": size,
+        "max_overflow": max_overflow,
+        "pool_timeout": timeout,
+    })
+    return options
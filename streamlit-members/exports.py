@@ -0,0 +1,99 @@
+"""Chunked CSV / Parquet encoders for streaming exports.
+
+Both take the column names and an iterable of row partitions (as produced by
+``Result.partitions()`` on a server-side cursor) and yield bytes as each
+partition is encoded, so memory stays bounded by one chunk.
+"""
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from sqlalchemy import Date, DateTime, Integer, Boolean
+
+
+def flatten(value: Any) -> Any:
+    """JSON list columns become '; '-joined text"""
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(v) for v in value)
+    if isinstance(value, dict):
+        return "; ".join(f"{k}={v}" for k, v in value.items())
+    return value
+
+
+def csv_chunks(columns: Sequence[str], partitions: Iterable[Sequence[Sequence[Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in partitions:
+        for row in rows:
+            writer.writerow([
+                v.isoformat() if isinstance(v, (date, datetime)) else flatten(v) for v in row
+            ])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands back whatever was written since the last take()"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def parquet_chunks(columns: Sequence[str], column_types: Dict[str, Any],
+                   partitions: Iterable[Sequence[Sequence[Any]]]) -> Iterator[bytes]:
+    """One Parquet row group per partition; requires pyarrow"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def arrow_type(sql_type):
+        if isinstance(sql_type, Boolean):
+            return pa.bool_()
+        if isinstance(sql_type, Integer):
+            return pa.int64()
+        if isinstance(sql_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(sql_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    schema = pa.schema([(name, arrow_type(column_types.get(name))) for name in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for rows in partitions:
+            data = {name: [] for name in columns}
+            for row in rows:
+                for name, value in zip(columns, row):
+                    value = flatten(value)
+                    if value is not None and pa.types.is_string(schema.field(name).type):
+                        value = str(value)
+                    data[name].append(value)
+            writer.write_table(pa.Table.from_pydict(data, schema=schema))
+            chunk = sink.take()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.take()
@@ -0,0 +1,82 @@
+"""Faceted job listing index for the Job Board.
+
+Each facet (job type, experience level, normalized location, company) maps a
+value to the set of job ids carrying it, so filtering is set intersection.
+Counts for every facet come back with the results: each facet is counted
+over the jobs matching all the *other* selected facets, so a dropdown shows
+what picking each option would return. Postings stop matching once their
+application deadline passes, without rebuilding the index.
+"""
+import bisect
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set
+
+ALL = "All"
+FACETS = ("job_type", "experience_level", "location", "company")
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """City part of a location: "los angeles, CA" is listed as "Los Angeles"."""
+    city = (location or "").split(",")[0]
+    return " ".join(city.split()).title() or "Unspecified"
+
+
+def normalize_value(value: Optional[str]) -> str:
+    return " ".join((value or "").split()) or "Unspecified"
+
+
+def accepting_applications(job: Dict, now: Optional[datetime] = None) -> bool:
+    deadline = job.get("application_deadline")
+    return job.get("status", "active") == "active" and (deadline is None or deadline > (now or datetime.now()))
+
+
+def facet_value(job: Dict, facet: str) -> str:
+    if facet == "location":
+        return normalize_location(job.get("location"))
+    return normalize_value(job.get(facet))
+
+
+class JobFacetIndex:
+    def __init__(self, jobs: List[Dict]):
+        self.jobs = {job["job_id"]: job for job in jobs if job.get("status", "active") == "active"}
+        self.order = list(self.jobs)
+        self.postings: Dict[str, Dict[str, Set[int]]] = {facet: {} for facet in FACETS}
+        for job_id, job in self.jobs.items():
+            for facet in FACETS:
+                self.postings[facet].setdefault(facet_value(job, facet), set()).add(job_id)
+
+        # Deadlines ascending; everything left of now has expired
+        dated = sorted((job["application_deadline"], job_id) for job_id, job in self.jobs.items()
+                       if job.get("application_deadline"))
+        self.deadlines = [deadline for deadline, _ in dated]
+        self.deadline_ids = [job_id for _, job_id in dated]
+
+    def live_ids(self, now: Optional[datetime] = None) -> Set[int]:
+        expired = bisect.bisect_right(self.deadlines, now or datetime.now())
+        return set(self.jobs).difference(self.deadline_ids[:expired])
+
+    def query(self, filters: Dict[str, str], ranked_ids: Optional[Sequence[int]] = None,
+              now: Optional[datetime] = None) -> Dict:
+        """Open jobs matching every selected facet: {'items', 'total', 'facets'}
+
+        ``filters`` maps facet -> selected value ("All" or missing for none).
+        ``ranked_ids`` restricts results to, and orders them by, a search ranking.
+        """
+        base = self.live_ids(now)
+        if ranked_ids is not None:
+            base &= set(ranked_ids)
+        selected = {facet: self.postings[facet].get(value, set())
+                    for facet, value in filters.items() if value and value != ALL}
+
+        facets = {}
+        for facet in FACETS:
+            others = [ids for other, ids in selected.items() if other != facet]
+            pool = base.intersection(*others) if others else base
+            # Values with no open job at all (e.g. every posting expired) are left out
+            facets[facet] = {value: len(ids & pool) for value, ids in sorted(self.postings[facet].items())
+                             if not ids.isdisjoint(base)}
+
+        matches = base.intersection(*selected.values()) if selected else base
+        order = ranked_ids if ranked_ids is not None else self.order
+        items = [self.jobs[job_id] for job_id in order if job_id in matches]
+        return {"items": items, "total": len(items), "facets": facets}
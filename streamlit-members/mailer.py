@@ -0,0 +1,227 @@
+"""Outbound mail queue for the USC TREA API.
+
+Handlers enqueue messages and return immediately; worker threads drain the
+queue in batches over a reused, authenticated SMTP session.
+"""
+import os
+import queue
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional
+
+
+@dataclass
+class OutboundEmail:
+    to_email: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+    def to_mime(self, from_email: Optional[str]) -> MIMEMultipart:
+        msg = MIMEMultipart()
+        msg['From'] = from_email
+        msg['To'] = self.to_email
+        msg['Subject'] = self.subject
+        msg.attach(MIMEText(self.body, 'html'))
+        return msg
+
+
+class SMTPTransport:
+    """Holds one authenticated SMTP session and reconnects when it drops"""
+
+    def __init__(self, host: str, port: int, user: Optional[str], password: Optional[str],
+                 use_tls: bool = True, timeout: int = 30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._server: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls()
+        if self.user:
+            server.login(self.user, self.password)
+        return server
+
+    def send(self, msg: MIMEMultipart):
+        if self._server is None:
+            self._server = self._connect()
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Session went away mid-send; retry once on a fresh connection
+            self._server = self._connect()
+            self._server.send_message(msg)
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except smtplib.SMTPException:
+                pass
+            self._server = None
+
+
+class FileTransport:
+    """Debug sink that writes each message to an .eml file instead of sending it"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._counter = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def send(self, msg: MIMEMultipart):
+        with self._lock:
+            self._counter += 1
+            name = f"{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}-{self._counter}.eml"
+        with open(os.path.join(self.directory, name), "w") as f:
+            f.write(msg.as_string())
+
+    def close(self):
+        pass
+
+
+class MailQueue:
+    """Background email dispatch with batching and retry/backoff"""
+
+    def __init__(self, transport_factory, from_email: Optional[str], workers: int = 1,
+                 batch_size: int = 20, max_retries: int = 3, retry_base_seconds: float = 2.0):
+        self.transport_factory = transport_factory
+        self.from_email = from_email
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self._queue: "queue.Queue[Optional[OutboundEmail]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        # Taken by a worker / waiting on a retry timer; neither shows in the queue size
+        self.in_flight = 0
+        self.retrying = 0
+        # Queued + in flight + retrying, updated in one step so it never reads 0 mid-handoff
+        self._unfinished = 0
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"mail-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0):
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def enqueue(self, to_email: str, subject: str, body: str):
+        self.start()
+        with self._lock:
+            self._unfinished += 1
+        self._queue.put(OutboundEmail(to_email, subject, body))
+
+    def pending(self) -> int:
+        """Emails waiting in the queue"""
+        return self._queue.qsize()
+
+    def unfinished(self) -> int:
+        """Emails not yet sent or given up on: queued, in flight or scheduled for a retry"""
+        with self._lock:
+            return self._unfinished
+
+    def _finish(self, sent: bool):
+        with self._lock:
+            self.in_flight -= 1
+            self._unfinished -= 1
+            if sent:
+                self.sent += 1
+            else:
+                self.failed += 1
+
+    def _next_batch(self) -> Optional[List[OutboundEmail]]:
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Hand the stop sentinel back so this worker exits after the batch
+                self._queue.put(None)
+                break
+            batch.append(item)
+        with self._lock:
+            self.in_flight += len(batch)
+        return batch
+
+    def _retry_later(self, email: OutboundEmail, error: Exception):
+        email.attempts += 1
+        if email.attempts > self.max_retries:
+            self._finish(sent=False)
+            print(f"Email error: giving up on {email.to_email} after {email.attempts} attempts: {error}")
+            return
+        with self._lock:
+            self.in_flight -= 1
+            self.retrying += 1
+        delay = self.retry_base_seconds * (2 ** (email.attempts - 1))
+        timer = threading.Timer(delay, self._requeue, (email,))
+        timer.daemon = True
+        timer.start()
+
+    def _requeue(self, email: OutboundEmail):
+        with self._lock:
+            self.retrying -= 1
+            stopped = not self._threads
+            if stopped:
+                # No worker left to send it; count it failed rather than strand it on the queue
+                self._unfinished -= 1
+                self.failed += 1
+            else:
+                self._queue.put(email)
+        if stopped:
+            print(f"Email error: dropping retry for {email.to_email}, mail queue stopped")
+
+    def _run(self):
+        transport = self.transport_factory()
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                for email in batch:
+                    try:
+                        transport.send(email.to_mime(self.from_email))
+                        self._finish(sent=True)
+                    except Exception as e:
+                        transport.close()
+                        self._retry_later(email, e)
+        finally:
+            transport.close()
+
+
+def wait_until_drained(mail_queue: MailQueue, timeout: float = 10.0) -> bool:
+    """Block until every email is sent or given up on, including ones in flight or
+    waiting to be retried; handy for tests using the file sink"""
+    deadline = time.monotonic() + timeout
+    while mail_queue.unfinished() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return mail_queue.unfinished() == 0
@@ -0,0 +1,109 @@
+"""Member Directory index: filter, sort and page the member listing.
+
+Built once from ``list_members()`` rows and per-user connection counts.
+Only members with a public profile are listed, and only their public view
+(``public_member``) is kept and returned; the join date is held as a sort
+key alone. Class year and specialization filters are set lookups, every
+sort order is computed at build time, and a query walks one presorted id
+list and returns just the requested page, so the page renders a handful of
+cards however large the membership gets.
+"""
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+ALL = "All"
+ALUMNI = "Alumni"  # class filter for members without an application
+SORTS = ("Name", "Class Year", "Join Date", "Connections")
+DEFAULT_PAGE_SIZE = 10
+
+
+def public_member(member: Dict) -> Dict:
+    """What one member may see of another: name, class year, major, and the bio and
+    specializations of a public profile. Same shape as a listing row, without the role."""
+    user, profile, application = member['user'], member['profile'], member['application']
+    listed = profile is not None and profile.get('is_public') is not False
+    return {
+        'user_id': member['user_id'],
+        'user': {'first_name': user['first_name'], 'last_name': user['last_name']},
+        'profile': {
+            'bio': profile.get('bio'),
+            'specializations': profile.get('specializations') or [],
+        } if listed else None,
+        'application': {
+            'graduation_year': application.get('graduation_year'),
+            'major': application.get('major'),
+        } if application else None,
+    }
+
+
+class DirectoryIndex:
+    def __init__(self, members: List[Dict], connection_counts: Dict[int, int]):
+        # Only members with a public profile are listed in the directory
+        listed = [m for m in members if m['profile'] and m['profile'].get('is_public') is not False]
+        self.members = {m['user_id']: public_member(m) for m in listed}
+        self.joined = {m['user_id']: m['user'].get('created_at') or datetime.min for m in listed}
+        self.connections = {uid: connection_counts.get(uid, 0) for uid in self.members}
+        self.names: Dict[int, str] = {}
+        self.by_class: Dict[str, Set[int]] = {}
+        self.by_specialization: Dict[str, Set[int]] = {}
+
+        for user_id, member in self.members.items():
+            user, application = member['user'], member['application']
+            self.names[user_id] = f"{user['first_name']} {user['last_name']}".lower()
+            class_key = str(application.get('graduation_year', '')) if application else ALUMNI
+            self.by_class.setdefault(class_key, set()).add(user_id)
+            for specialization in member['profile'].get('specializations') or []:
+                self.by_specialization.setdefault(specialization, set()).add(user_id)
+
+        def graduation_year(uid):
+            application = self.members[uid]['application']
+            year = application.get('graduation_year') if application else None
+            return (year is None, year or 0, uid)
+
+        self.orders: Dict[str, List[int]] = {
+            "Name": sorted(self.members, key=lambda uid: (
+                self.members[uid]['user']['last_name'].lower(),
+                self.members[uid]['user']['first_name'].lower(), uid
+            )),
+            "Class Year": sorted(self.members, key=graduation_year),
+            "Join Date": sorted(self.members, key=lambda uid: (self.joined[uid], -uid), reverse=True),
+            "Connections": sorted(self.members, key=lambda uid: (-self.connections[uid], uid)),
+        }
+
+    def _candidates(self, class_year: str, specialization: str) -> Optional[Set[int]]:
+        """Ids passing the indexed filters; None when neither filter is set"""
+        sets = []
+        if class_year != ALL:
+            sets.append(self.by_class.get(class_year, set()))
+        if specialization != ALL:
+            sets.append(self.by_specialization.get(specialization, set()))
+        if not sets:
+            return None
+        return set.intersection(*sorted(sets, key=len))
+
+    def query(self, name_search: str = "", class_year: str = ALL, specialization: str = ALL,
+              sort_by: str = "Name", page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """One page of matches: {'items', 'total', 'page', 'pages', 'page_size'}"""
+        if sort_by not in self.orders:
+            raise ValueError(f"Unknown directory sort '{sort_by}' (expected one of {', '.join(SORTS)})")
+        candidates = self._candidates(class_year, specialization)
+        needle = name_search.strip().lower()
+        matches = [
+            uid for uid in self.orders[sort_by]
+            if (candidates is None or uid in candidates) and needle in self.names[uid]
+        ]
+
+        pages = max(1, math.ceil(len(matches) / page_size))
+        page = min(max(page, 1), pages)
+        start = (page - 1) * page_size
+        return {
+            "items": [
+                {**self.members[uid], "connections": self.connections[uid]}
+                for uid in matches[start:start + page_size]
+            ],
+            "total": len(matches),
+            "page": page,
+            "pages": pages,
+            "page_size": page_size,
+        }
@@ -0,0 +1,41 @@
+"""Alumni-to-member matching, shared by backend_api and the portal storages.
+
+Approved members are indexed by career interest, and each alum's
+specializations are looked up tag by tag, so only members sharing at least
+one tag are scored.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class InterestIndex:
+    """Inverted index from career interest to approved member ids"""
+
+    def __init__(self, interests_by_member: Iterable[Tuple[int, Optional[List[str]]]] = ()):
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for member_id, interests in interests_by_member:
+            for interest in interests or []:
+                postings[interest].add(member_id)
+        self.postings: Dict[str, Set[int]] = dict(postings)
+
+    def candidates(self, tags: Iterable[str]) -> Dict[int, List[str]]:
+        """Return {member_id: shared tags} for members sharing at least one tag"""
+        shared: Dict[int, List[str]] = defaultdict(list)
+        for tag in set(tags):
+            for member_id in self.postings.get(tag, ()):
+                shared[member_id].append(tag)
+        return shared
+
+
+def rank_matches(index: InterestIndex, alumni: Iterable[Tuple[int, Optional[List[str]]]]) -> List[Dict]:
+    """{alumni_id, member_id, match_score, common_interests} per alum/member pair, best first"""
+    matches = []
+    for alumni_id, specializations in alumni:
+        for member_id, common_interests in index.candidates(specializations or []).items():
+            matches.append({
+                "alumni_id": alumni_id,
+                "member_id": member_id,
+                "match_score": len(common_interests),
+                "common_interests": sorted(common_interests)
+            })
+    return sorted(matches, key=lambda x: (-x["match_score"], x["alumni_id"], x["member_id"]))
@@ -0,0 +1,94 @@
+"""In-process fan-out of live mailbox events, keyed by recipient.
+
+Every open message stream subscribes a bounded queue under its user id, and
+publishing to a user puts one pre-encoded Server-Sent Events frame on each of
+that user's queues: a send costs a dict lookup plus one enqueue per tab the
+recipient has open, whatever the number of other connections. A stream that
+stops reading until its queue fills is cut off instead of buffered without
+bound; the client reconnects with Last-Event-ID and replays from the database.
+
+Publishing and consuming both happen on the worker's event loop. Subscribers
+only see events published by their own worker process, so a deployment with
+several workers needs a shared broker (e.g. Redis pub/sub) behind ``publish``.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+KEEPALIVE = b": keepalive\n\n"
+Frame = Tuple[Optional[int], bytes]  # (event id for Last-Event-ID, encoded frame)
+
+
+def sse_frame(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str, separators=(',', ':'))}"]
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class Subscription:
+    def __init__(self, user_id: int, max_pending: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Optional[Frame]]" = asyncio.Queue(max_pending)
+
+    async def next(self, keepalive_seconds: float) -> Optional[Frame]:
+        """Next frame, a keepalive comment after keepalive_seconds idle, or None once cut off"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), keepalive_seconds)
+        except asyncio.TimeoutError:
+            return None, KEEPALIVE
+
+
+class MessageBus:
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max(max_pending, 1)
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self.connections = 0
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(user_id, self.max_pending)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        self.connections += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.user_id]
+        self.connections -= 1
+
+    def _cut_off(self, subscription: Subscription):
+        # Drop the backlog and leave only the end-of-stream marker
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        self.unsubscribe(subscription)
+        self.dropped += 1
+
+    def publish(self, user_ids: Iterable[int], frame: bytes, event_id: Optional[int] = None) -> int:
+        """Queue one frame for every open stream of each user; returns streams reached"""
+        self.published += 1
+        reached = 0
+        for user_id in set(user_ids):
+            for subscription in list(self._subscribers.get(user_id, ())):
+                try:
+                    subscription.queue.put_nowait((event_id, frame))
+                    reached += 1
+                except asyncio.QueueFull:
+                    self._cut_off(subscription)
+        self.delivered += reached
+        return reached
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "connections": self.connections,
+            "users": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
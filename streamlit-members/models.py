@@ -0,0 +1,262 @@
+"""SQLAlchemy models shared by the API and the portal's SQL storage backend."""
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, Integer, String, Date, DateTime, Boolean, JSON, ForeignKey, Enum, Text,
+    UniqueConstraint, Index, func, select, update
+)
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+Base = declarative_base()
+
+class User(Base):
+    __tablename__ = "users"
+    
+    user_id = Column(Integer, primary_key=True, index=True)
+    email = Column(String(100), unique=True, index=True)
+    password_hash = Column(String(255))
+    first_name = Column(String(50))
+    last_name = Column(String(50))
+    phone = Column(String(20))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_login = Column(DateTime)
+    status = Column(Enum("active", "inactive", "pending", name="user_status"), default="pending")
+    unread_message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    # Relationships
+    applications = relationship("MemberApplication", back_populates="user", foreign_keys="MemberApplication.user_id")
+    collaborations = relationship("AlumniCollaboration", back_populates="user")
+    roles = relationship("UserRole", back_populates="user")
+    profile = relationship("MemberProfile", back_populates="user", uselist=False)
+
+class MemberApplication(Base):
+    __tablename__ = "member_applications"
+    
+    application_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"))
+    graduation_year = Column(Integer)
+    major = Column(String(100))
+    career_interests = Column(JSON)
+    interest_reason = Column(Text)
+    experience = Column(Text)
+    goals = Column(Text)
+    application_status = Column(
+        Enum("pending", "approved", "rejected", name="application_status"), 
+        default="pending",
+        index=True
+    )
+    submitted_at = Column(DateTime, default=datetime.utcnow)
+    reviewed_at = Column(DateTime)
+    reviewed_by = Column(Integer, ForeignKey("users.user_id"))
+    
+    # Relationships
+    user = relationship("User", back_populates="applications", foreign_keys=[user_id])
+
+class AlumniCollaboration(Base):
+    __tablename__ = "alumni_collaborations"
+    
+    collaboration_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"))
+    company = Column(String(100))
+    position = Column(String(100))
+    industry = Column(String(50))
+    collaboration_type = Column(
+        Enum("mentorship", "speaking", "funding", "consulting", name="collaboration_type"),
+        index=True
+    )
+    collaboration_details = Column(Text)
+    linkedin_url = Column(String(255))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    is_active = Column(Boolean, default=True)
+    
+    # Relationships
+    user = relationship("User", back_populates="collaborations")
+
+class MemberProfile(Base):
+    __tablename__ = "member_profiles"
+    
+    profile_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), unique=True)
+    bio = Column(Text)
+    linkedin_url = Column(String(255))
+    experience_level = Column(
+        Enum("student", "alumni", "professional", name="experience_level")
+    )
+    specializations = Column(JSON)
+    portfolio_projects = Column(JSON)
+    profile_image_url = Column(String(500))
+    is_public = Column(Boolean, default=True)
+    
+    # Relationships
+    user = relationship("User", back_populates="profile")
+
+class Resource(Base):
+    __tablename__ = "resources"
+    
+    resource_id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(200))
+    description = Column(Text)
+    file_url = Column(String(500))
+    resource_type = Column(String(50))
+    access_level = Column(
+        Enum("public", "member", "admin", name="access_level"), 
+        default="member"
+    )
+    created_by = Column(Integer, ForeignKey("users.user_id"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    download_count = Column(Integer, default=0)
+    tags = Column(JSON)
+
+class Event(Base):
+    __tablename__ = "events"
+    
+    event_id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(200))
+    description = Column(Text)
+    event_date = Column(DateTime)
+    event_type = Column(String(50))
+    location = Column(String(200))
+    virtual_link = Column(String(500))
+    registration_required = Column(Boolean, default=True)
+    max_attendees = Column(Integer)
+    # Seats taken. Databases created before this column must add it and then run
+    # backfill_registered_counts once, or every existing event starts at 0 and overbooks.
+    registered_count = Column(Integer, nullable=False, default=0, server_default="0")
+    waitlist_seq = Column(Integer, nullable=False, default=0, server_default="0")
+    created_by = Column(Integer, ForeignKey("users.user_id"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    registrations = relationship("EventRegistration", back_populates="event")
+
+class EventRegistration(Base):
+    __tablename__ = "event_registrations"
+    __table_args__ = (UniqueConstraint("event_id", "user_id", name="uq_event_registration"),)
+    
+    registration_id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.event_id"))
+    user_id = Column(Integer, ForeignKey("users.user_id"))
+    registered_at = Column(DateTime, default=datetime.utcnow)
+    attended = Column(Boolean, default=False)
+    
+    # Relationships
+    event = relationship("Event", back_populates="registrations")
+
+class EventWaitlistEntry(Base):
+    __tablename__ = "event_waitlist"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_event_waitlist_user"),
+        Index("ix_event_waitlist_order", "event_id", "ticket"),
+    )
+    
+    entry_id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.event_id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+    ticket = Column(Integer, nullable=False)  # per-event, strictly increasing
+    joined_at = Column(DateTime, default=datetime.utcnow)
+
+class JobPosting(Base):
+    __tablename__ = "job_postings"
+    
+    job_id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(200))
+    company = Column(String(200), index=True)
+    location = Column(String(200))
+    job_type = Column(String(50))
+    experience_level = Column(String(50))
+    description = Column(Text)
+    requirements = Column(JSON)
+    salary_range = Column(String(100))
+    posted_by = Column(Integer, ForeignKey("users.user_id"), index=True)
+    posted_date = Column(DateTime, default=datetime.utcnow)
+    application_deadline = Column(DateTime)
+    status = Column(
+        Enum("active", "closed", name="job_status"),
+        default="active", index=True
+    )
+    application_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+class JobApplication(Base):
+    __tablename__ = "job_applications"
+    # The unique constraint doubles as the per-posting index (job_id leads)
+    __table_args__ = (UniqueConstraint("job_id", "user_id", name="uq_job_application"),)
+    
+    application_id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("job_postings.job_id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    status = Column(
+        Enum("submitted", "under_review", "interview_scheduled", "offered", "rejected", "withdrawn",
+             name="job_application_status"),
+        nullable=False, default="submitted"
+    )
+    applied_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class UserRole(Base):
+    __tablename__ = "user_roles"
+    
+    role_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"))
+    role_name = Column(
+        Enum("admin", "member", "alumni", name="role_name")
+    )
+    permissions = Column(JSON)
+    assigned_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    user = relationship("User", back_populates="roles")
+
+class DailyRollup(Base):
+    __tablename__ = "analytics_daily_rollups"
+    __table_args__ = (UniqueConstraint("day", "metric", name="uq_rollup_day_metric"),)
+    
+    rollup_id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False, index=True)
+    metric = Column(String(50), nullable=False)
+    value = Column(Integer, nullable=False, default=0)
+
+class Message(Base):
+    __tablename__ = "messages"
+    # Inbox pages walk one recipient's messages newest-first by id
+    __table_args__ = (Index("ix_messages_inbox", "to_user", "message_id"),)
+    
+    message_id = Column(Integer, primary_key=True, index=True)
+    from_user = Column(Integer, ForeignKey("users.user_id"))
+    to_user = Column(Integer, ForeignKey("users.user_id"))
+    subject = Column(String(200))
+    message = Column(Text)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+    read = Column(Boolean, default=False)
+
+class MemberConnection(Base):
+    __tablename__ = "member_connections"
+    __table_args__ = (UniqueConstraint("user_id", "connected_user_id", name="uq_member_connection"),)
+    
+    connection_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    connected_user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+def backfill_registered_counts(connection) -> int:
+    """Set every event's registered_count from its event_registrations rows; returns events updated.
+
+    One-off step for databases created before the column existed:
+
+        ALTER TABLE events ADD COLUMN registered_count INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE events ADD COLUMN waitlist_seq INTEGER NOT NULL DEFAULT 0;
+        -- then, in the same transaction or before the API takes registrations:
+        UPDATE events SET registered_count = (
+            SELECT COUNT(*) FROM event_registrations
+            WHERE event_registrations.event_id = events.event_id
+        );
+
+    e.g. ``with engine.begin() as conn: backfill_registered_counts(conn)``
+    """
+    seats = (
+        select(func.count())
+        .where(EventRegistration.event_id == Event.event_id)
+        .scalar_subquery()
+    )
+    return connection.execute(update(Event).values(registered_count=seats)).rowcount
@@ -0,0 +1,224 @@
+"""Shared data access for the portal pages.
+
+Holds the process-wide storage backend, the session's view of it and the
+st.cache_data loaders every page reads through. Nothing here imports pandas
+or plotly; the pages that chart data import those themselves.
+"""
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from job_index import JobFacetIndex
+from storage import DIRECTORY_TABLES, PortalStorage, create_storage
+
+# Storage configuration: "memory" serves the demo data, "sql" persists to PORTAL_DATABASE_URL,
+# "api" reads and writes through backend_api at PORTAL_API_URL
+PORTAL_STORAGE = os.getenv("PORTAL_STORAGE", "memory")
+PORTAL_DATABASE_URL = os.getenv("PORTAL_DATABASE_URL", "sqlite:///portal.db")
+PORTAL_DB_POOL_SIZE = int(os.getenv("PORTAL_DB_POOL_SIZE", "5"))
+PORTAL_DB_MAX_OVERFLOW = int(os.getenv("PORTAL_DB_MAX_OVERFLOW", "10"))
+PORTAL_CACHE_TTL_SECONDS = int(os.getenv("PORTAL_CACHE_TTL_SECONDS", "300"))
+# "api" makes the portal a client of backend_api; responses are cached briefly per session token
+PORTAL_API_URL = os.getenv("PORTAL_API_URL", "http://localhost:8000")
+PORTAL_API_CACHE_TTL_SECONDS = float(os.getenv("PORTAL_API_CACHE_TTL_SECONDS", "5"))
+PORTAL_API_TIMEOUT_SECONDS = float(os.getenv("PORTAL_API_TIMEOUT_SECONDS", "10"))
+
+# Storage backend, created once per process and shared by every session
+@st.cache_resource
+def get_storage() -> PortalStorage:
+    return create_storage(
+        PORTAL_STORAGE,
+        PORTAL_DATABASE_URL,
+        pool_size=PORTAL_DB_POOL_SIZE,
+        max_overflow=PORTAL_DB_MAX_OVERFLOW,
+        api_url=PORTAL_API_URL,
+        api_cache_ttl=PORTAL_API_CACHE_TTL_SECONDS,
+        api_timeout=PORTAL_API_TIMEOUT_SECONDS
+    )
+
+def session_storage() -> PortalStorage:
+    """This session's view of the shared storage (carries its API token in "api" mode)"""
+    return get_storage().for_session(st.session_state.get('api_token'))
+
+def reset_session():
+    for key in ['logged_in', 'user_data', 'user_id', 'user_role', 'access_level', 'api_token']:
+        if key in st.session_state:
+            st.session_state[key] = None if key != 'logged_in' else False
+
+# Cached page data. Each loader takes the versions of the tables it reads as its
+# last argument, so a portal write makes the next call miss while reruns from
+# unrelated widgets hit; the TTL bounds staleness from other processes' writes.
+MEMBER_TABLES = ("users", "member_profiles", "member_applications", "user_roles")
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_members(version) -> List[Dict]:
+    return session_storage().list_members()
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_public_members(version) -> List[Dict]:
+    return session_storage().list_public_members()
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_profile(user_id: int, version) -> Optional[Dict]:
+    return session_storage().get_profile(user_id)
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_application(user_id: int, version) -> Optional[Dict]:
+    return session_storage().get_application(user_id)
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_events(version) -> List[Dict]:
+    return session_storage().list_events()
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_resources(version) -> List[Dict]:
+    return session_storage().list_resources()
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_job_postings(version) -> List[Dict]:
+    return session_storage().list_job_postings()
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_inbox_page(user_id: int, cursor: Optional[int], unread_only: bool, limit: int, version) -> Dict:
+    return session_storage().inbox_page(user_id, limit, cursor, unread_only)
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_directory_page(name_search: str, class_year: str, specialization: str, sort_by: str,
+                        page: int, page_size: int, version) -> Dict:
+    return session_storage().directory_page(name_search, class_year, specialization, sort_by, page, page_size)
+
+def members() -> List[Dict]:
+    """Full member rows, for admin pages; the API only serves these to admins"""
+    return load_members(session_storage().table_version(*MEMBER_TABLES))
+
+def public_members() -> List[Dict]:
+    """What any signed-in member may see of the others: names, class, major, public profiles"""
+    return load_public_members(session_storage().table_version(*MEMBER_TABLES))
+
+def events() -> List[Dict]:
+    return load_events(session_storage().table_version("events"))
+
+def resources() -> List[Dict]:
+    return load_resources(session_storage().table_version("resources"))
+
+def job_postings() -> List[Dict]:
+    return load_job_postings(session_storage().table_version("job_postings"))
+
+def directory_page(name_search: str, class_year: str, specialization: str, sort_by: str,
+                   page: int, page_size: int) -> Dict:
+    return load_directory_page(name_search, class_year, specialization, sort_by, page, page_size,
+                               session_storage().table_version(*DIRECTORY_TABLES))
+
+# Authentication functions
+def authenticate_user(email: str, password: str) -> Optional[Dict]:
+    """Authenticate user and return user data if valid"""
+    session = get_storage().authenticate(email, password)
+    if session is None:
+        return None
+    user_id = session['user_id']
+    storage = get_storage().for_session(session['token'])
+    role_data = storage.get_role(user_id)
+    return {
+        'user_id': user_id,
+        'token': session['token'],
+        'user_data': storage.get_user(user_id),
+        'role': role_data['role_name'] if role_data else 'member',
+        'permissions': role_data['permissions'] if role_data else []
+    }
+
+def get_user_profile(user_id: int) -> Optional[Dict]:
+    """Get user profile information"""
+    return load_profile(user_id, session_storage().table_version("member_profiles"))
+
+def get_user_application(user_id: int) -> Optional[Dict]:
+    """Get user's member application"""
+    return load_application(user_id, session_storage().table_version("member_applications"))
+
+# Alumni matching: the backend's interest-index ranking, whichever storage is configured
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_matches(alumni_id: int, collaboration_type: str, version) -> List[Dict]:
+    return session_storage().match_members(alumni_id, collaboration_type)
+
+def match_alumni_to_members(alumni_id: int, collaboration_type: str) -> List[Dict]:
+    """Approved members matching an alum's expertise, best first, with their shared interests"""
+    return load_matches(alumni_id, collaboration_type, session_storage().table_version(
+        *MEMBER_TABLES, "alumni_collaborations"
+    ))
+
+# Analytics functions
+def generate_member_analytics():
+    """Generate analytics for the dashboard"""
+    return load_member_analytics(session_storage().table_version(
+        *MEMBER_TABLES, "alumni_collaborations", "resources", "events", "job_postings"
+    ))
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_member_analytics(version) -> Dict:
+    total_members = len([m for m in members()
+                         if m['application'] and m['application']['application_status'] == 'approved'])
+    total_alumni = session_storage().count_alumni_collaborations()
+    total_resources = len(resources())
+    upcoming_events = len([e for e in events() if e['event_date'] > datetime.now()])
+    active_jobs = len([j for j in job_postings() if j['status'] == 'active'])
+    
+    return {
+        'total_members': total_members,
+        'total_alumni': total_alumni,
+        'total_resources': total_resources,
+        'upcoming_events': upcoming_events,
+        'active_jobs': active_jobs,
+        'member_growth': 23,  # Mock data
+        'engagement_rate': 78,  # Mock data
+        'job_placement_rate': 85,
+        'mentor_matches': 15
+    }
+
+INBOX_PAGE_SIZE = 20
+
+def get_inbox_page(user_id: int, cursor: Optional[int] = None, unread_only: bool = False) -> Dict:
+    """Newest-first page of a user's messages: {'items', 'next_cursor'}"""
+    return load_inbox_page(user_id, cursor, unread_only, INBOX_PAGE_SIZE,
+                           session_storage().table_version("messages"))
+
+def get_unread_count(user_id: int) -> int:
+    # A maintained counter, so it is read fresh on every rerun rather than cached
+    return session_storage().unread_count(user_id)
+
+def join_event_waitlist(event_id: int, user_id: int) -> int:
+    """Add user to an event's waitlist (idempotent) and return their 1-based position"""
+    return session_storage().join_waitlist(event_id, user_id)
+
+def get_waitlist_position(event_id: int, user_id: int) -> Optional[int]:
+    """Get user's position on an event waitlist, if any"""
+    return session_storage().waitlist_position(event_id, user_id)
+
+def search_content(query: str, doc_type: str) -> List[int]:
+    """Ids of matching documents of one type, best match first"""
+    return session_storage().search(query, doc_type)
+
+@st.cache_resource(max_entries=1)
+def get_job_index(version) -> JobFacetIndex:
+    return JobFacetIndex(job_postings())
+
+def job_listing(filters: Dict[str, str], search: str = "") -> Dict:
+    """Open jobs matching the facet filters (and search text, ranked), with facet counts"""
+    index = get_job_index(session_storage().table_version("job_postings"))
+    return index.query(filters, search_content(search, 'job') if search.strip() else None)
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_job_applications(user_id: int, version) -> List[Dict]:
+    return session_storage().get_job_applications(user_id)
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_received_applications(poster_id: int, version) -> List[Dict]:
+    return session_storage().get_received_applications(poster_id)
+
+def get_job_applications(user_id: int) -> List[Dict]:
+    """Job applications a user has made, newest first"""
+    return load_job_applications(user_id, session_storage().table_version("job_applications"))
+
+def get_received_applications(poster_id: int) -> List[Dict]:
+    """Applications to the job postings a user made"""
+    return load_received_applications(poster_id, session_storage().table_version("job_applications"))
@@ -0,0 +1,38 @@
+"""Portal pages, one module per page.
+
+A page module is imported the first time someone opens it, so the login page
+and light pages never load pandas or plotly. Each module exposes ``render()``.
+"""
+import importlib
+from typing import Optional
+
+# (role, page) -> module; role None means the page is shared by every role
+PAGE_MODULES = {
+    ("admin", "Admin Dashboard"): "admin_dashboard",
+    ("admin", "Member Management"): "member_management",
+    ("admin", "Application Review"): "application_review",
+    ("alumni", "Alumni Dashboard"): "alumni_dashboard",
+    ("alumni", "Collaboration Hub"): "collaboration_hub",
+    ("member", "Member Dashboard"): "member_dashboard",
+    (None, "Job Board"): "job_board",
+    (None, "Portfolio"): "portfolio",
+    (None, "Networking"): "networking",
+    (None, "Resources"): "resources",
+    (None, "Events"): "events",
+    (None, "Directory"): "directory",
+    (None, "Profile"): "profile",
+    (None, "Settings"): "profile",
+}
+
+
+def page_module(role: Optional[str], page: str) -> Optional[str]:
+    return PAGE_MODULES.get((role, page)) or PAGE_MODULES.get((None, page))
+
+
+def render_page(role: Optional[str], page: str) -> bool:
+    """Import and render the page; False for pages that have no content yet"""
+    module = page_module(role, page)
+    if module is None:
+        return False
+    importlib.import_module(f"{__name__}.{module}").render()
+    return True
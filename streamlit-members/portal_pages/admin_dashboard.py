@@ -0,0 +1,145 @@
+"""Admin Dashboard page."""
+import random
+from typing import Dict
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from portal_data import PORTAL_CACHE_TTL_SECONDS, events, generate_member_analytics
+
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def build_admin_charts() -> Dict:
+    """Admin Dashboard figures, built once per TTL instead of on every rerun"""
+    dates = pd.date_range(start='2023-01-01', end='2024-01-01', freq='M')
+    growth_data = pd.DataFrame({
+        'Date': dates,
+        'Members': [350 + i*5 + random.randint(-10, 20) for i in range(len(dates))],
+        'Alumni': [150 + i*2 + random.randint(-5, 10) for i in range(len(dates))]
+    })
+    growth = px.line(growth_data, x='Date', y=['Members', 'Alumni'],
+                     title="Membership Growth Over Time")
+    growth.update_layout(height=350)
+    
+    placement_data = pd.DataFrame({
+        'Company Type': ['Investment/REPE', 'Development', 'Brokerage', 'Consulting', 'Other'],
+        'Placements': [15, 12, 8, 5, 3]
+    })
+    placements = px.pie(placement_data, values='Placements', names='Company Type',
+                        title="Job Placements by Industry")
+    placements.update_layout(height=350)
+    
+    # Event attendance
+    event_data = pd.DataFrame({
+        'Event': ['CBRE Recruiting', 'REPE Panel', 'Market Deep Dive', 'Networking', 'Workshop'],
+        'Attendance': [32, 67, 45, 28, 22]
+    })
+    attendance = px.bar(event_data, x='Event', y='Attendance', title="Event Attendance")
+    attendance.update_layout(height=300)
+    
+    # Resource downloads
+    resource_data = pd.DataFrame({
+        'Resource Type': ['Models', 'Reports', 'Guides', 'Templates'],
+        'Downloads': [145, 89, 67, 34]
+    })
+    downloads = px.bar(resource_data, x='Resource Type', y='Downloads', title="Resource Downloads")
+    downloads.update_layout(height=300)
+    
+    # Member activity heatmap data
+    activity_data = pd.DataFrame({
+        'Day': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+        'Logins': [45, 52, 48, 55, 42, 18, 12]
+    })
+    logins = px.bar(activity_data, x='Day', y='Logins', title="Daily Login Activity")
+    logins.update_layout(height=300)
+    
+    geo_data = pd.DataFrame({
+        'Location': ['Los Angeles', 'San Francisco', 'New York', 'Chicago', 'Seattle', 'Other'],
+        'Members': [45, 12, 8, 5, 3, 7],
+        'Alumni': [15, 8, 12, 6, 4, 5]
+    })
+    geo = px.bar(geo_data, x='Location', y=['Members', 'Alumni'],
+                 title="Member Distribution by Location", barmode='group')
+    geo.update_layout(height=400)
+    
+    return {"growth": growth, "placements": placements, "events": attendance,
+            "downloads": downloads, "logins": logins, "geo": geo}
+
+
+def render():
+    st.title("Admin Dashboard")
+    
+    # Analytics metrics
+    analytics = generate_member_analytics()
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Active Members", analytics['total_members'], f"+{analytics['member_growth']} this month")
+    with col2:
+        st.metric("Alumni Partners", analytics['total_alumni'], "+5 this quarter")
+    with col3:
+        st.metric("Active Jobs", analytics['active_jobs'], "+2 this week")
+    with col4:
+        st.metric("Placement Rate", f"{analytics['job_placement_rate']}%", "+3%")
+    with col5:
+        st.metric("Mentor Matches", analytics['mentor_matches'], "+2 this month")
+    
+    st.markdown("---")
+    
+    # Recent activity
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Recent Applications")
+        applications_df = pd.DataFrame([
+            {"Name": "Kyle Tran", "Year": "2026", "Status": "Pending", "Date": "2024-01-20"},
+            {"Name": "Sophia Lee", "Year": "2025", "Status": "Pending", "Date": "2024-01-19"},
+            {"Name": "Oscar Yan", "Year": "2027", "Status": "Approved", "Date": "2024-01-18"},
+        ])
+        st.dataframe(applications_df, use_container_width=True)
+    
+    with col2:
+        st.subheader("Upcoming Events")
+        for event in events()[:3]:
+            with st.container():
+                st.markdown(f"**{event['title']}**")
+                if event['max_attendees'] is None:
+                    st.caption(f"{event['event_date'].strftime('%B %d, %Y')} | {event['current_attendees']} registered")
+                else:
+                    st.caption(f"{event['event_date'].strftime('%B %d, %Y')} | {event['current_attendees']}/{event['max_attendees']} registered")
+                    st.progress(event['current_attendees'] / event['max_attendees'])
+    
+    # Advanced analytics section
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    charts = build_admin_charts()
+    
+    with col1:
+        st.subheader("Member Growth Trend")
+        st.plotly_chart(charts['growth'], use_container_width=True)
+    
+    with col2:
+        st.subheader("Job Placement Analysis")
+        st.plotly_chart(charts['placements'], use_container_width=True)
+    
+    # Engagement metrics
+    st.markdown("---")
+    st.subheader("Member Engagement Analytics")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.plotly_chart(charts['events'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(charts['downloads'], use_container_width=True)
+    
+    with col3:
+        st.plotly_chart(charts['logins'], use_container_width=True)
+    
+    # Geographic distribution
+    st.markdown("---")
+    st.subheader("Member Geographic Distribution")
+    st.plotly_chart(charts['geo'], use_container_width=True)
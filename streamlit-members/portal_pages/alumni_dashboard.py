@@ -0,0 +1,64 @@
+"""Alumni Dashboard page."""
+import pandas as pd
+import streamlit as st
+
+from portal_data import get_received_applications, get_user_profile
+
+def render():
+    st.title("Alumni Dashboard")
+    
+    profile = get_user_profile(st.session_state.user_id)
+    
+    # Welcome message
+    st.markdown(f"### Welcome back, {st.session_state.user_data['first_name']}!")
+    st.markdown(f"Thank you for being part of the TREA alumni network.")
+    
+    # Collaboration stats
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Students Mentored", "12", "+3 this semester")
+    with col2:
+        st.metric("Events Participated", "5", "+1 upcoming")
+    with col3:
+        st.metric("Job Posts", "3", "2 filled")
+    
+    st.markdown("---")
+    
+    # Current collaborations
+    st.subheader("Your Active Collaborations")
+    
+    collab_data = pd.DataFrame([
+        {"Type": "Mentorship", "Students": 3, "Status": "Active", "Started": "2024-01-01"},
+        {"Type": "Guest Speaking", "Event": "REPE Panel", "Date": "2024-02-15", "Status": "Scheduled"},
+    ])
+    st.dataframe(collab_data, use_container_width=True)
+    
+    # Applicants to this alumnus's job postings
+    st.subheader("Applications to Your Postings")
+    received = get_received_applications(st.session_state.user_id)
+    if received:
+        st.dataframe(pd.DataFrame([
+            {
+                "Position": f"{app['title']} ({app['company']})",
+                "Applicant": f"{app['first_name']} {app['last_name']}",
+                "Email": app['email'],
+                "Status": app['status'].replace('_', ' ').title(),
+                "Applied": app['applied_at'].strftime('%Y-%m-%d'),
+            }
+            for app in received
+        ]), use_container_width=True, hide_index=True)
+    else:
+        st.info("No applications to your job postings yet.")
+    
+    # Quick actions
+    st.subheader("Quick Actions")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("Post Job Opportunity", use_container_width=True):
+            st.session_state.show_job_form = True
+    with col2:
+        if st.button("Schedule Speaking Event", use_container_width=True):
+            st.session_state.show_event_form = True
+    with col3:
+        if st.button("Update Availability", use_container_width=True):
+            st.session_state.show_availability = True
@@ -0,0 +1,64 @@
+"""Application Review page."""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+
+def render():
+    st.title("Application Review")
+    
+    # Pending applications
+    st.subheader("Pending Applications")
+    
+    # Mock pending applications
+    pending_apps = [
+        {
+            "id": 1,
+            "name": "Kyle Tran",
+            "email": "ktran@usc.edu",
+            "year": 2026,
+            "major": "Finance",
+            "gpa": 3.8,
+            "interests": ["Investment/REPE", "Development"],
+            "experience": "Summer analyst at JLL",
+            "submitted": datetime.now() - timedelta(days=2)
+        },
+        {
+            "id": 2,
+            "name": "Sophia Lee",
+            "email": "slee@usc.edu",
+            "year": 2025,
+            "major": "Real Estate Development",
+            "gpa": 3.6,
+            "interests": ["Development", "Asset Management"],
+            "experience": "Research assistant",
+            "submitted": datetime.now() - timedelta(days=3)
+        }
+    ]
+    
+    for app in pending_apps:
+        with st.expander(f"{app['name']} - {app['year']} ({app['submitted'].strftime('%Y-%m-%d')})"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Personal Information**")
+                st.write(f"Email: {app['email']}")
+                st.write(f"Major: {app['major']}")
+                st.write(f"GPA: {app['gpa']}")
+            
+            with col2:
+                st.markdown("**Career Interests**")
+                st.write("Areas: " + ", ".join(app['interests']))
+                st.write(f"Experience: {app['experience']}")
+            
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if st.button(f"Approve", key=f"approve_{app['id']}"):
+                    st.success(f"Approved {app['name']}'s application")
+            with col2:
+                if st.button(f"Request Info", key=f"info_{app['id']}"):
+                    st.info("Email sent requesting additional information")
+            with col3:
+                if st.button(f"Reject", key=f"reject_{app['id']}"):
+                    st.error(f"Rejected {app['name']}'s application")
@@ -0,0 +1,34 @@
+"""Collaboration Hub page."""
+import streamlit as st
+
+from portal_data import match_alumni_to_members
+
+def render():
+    st.title("Collaboration Hub")
+    
+    st.markdown("### Matched Students Based on Your Expertise")
+    
+    # Get matched students
+    matches = match_alumni_to_members(st.session_state.user_id, 'mentorship')
+    
+    if matches:
+        for match in matches[:5]:  # Show top 5 matches
+            with st.container():
+                col1, col2, col3 = st.columns([3, 2, 1])
+                
+                with col1:
+                    st.markdown(f"**{match['user']['first_name']} {match['user']['last_name']}**")
+                    if match['application']:
+                        st.caption(f"Class of {match['application']['graduation_year']} | {match['application']['major']}")
+                    st.write("Shared interests: " + ", ".join(match['common_interests']))
+                
+                with col2:
+                    st.write(f"Match Score: {'⭐' * match['match_score']}")
+                    if match['profile'] and match['profile']['bio']:
+                        st.caption(match['profile']['bio'][:100] + "...")
+                
+                with col3:
+                    if st.button("Connect", key=f"connect_{match['user_id']}"):
+                        st.success("Connection request sent!")
+                
+                st.markdown("---")
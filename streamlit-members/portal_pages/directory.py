@@ -0,0 +1,87 @@
+"""Member Directory page."""
+import streamlit as st
+
+from member_directory import SORTS
+from portal_data import directory_page
+
+PAGE_SIZE = 10
+
+
+def render():
+    st.title("👥 Member Directory")
+    
+    # Search and filter options
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        name_search = st.text_input("Search by name", placeholder="Enter name...")
+    with col2:
+        class_filter = st.selectbox("Class Year", ["All", "2024", "2025", "2026", "2027", "Alumni"])
+    with col3:
+        specialization_filter = st.selectbox("Specialization", ["All", "Financial Modeling", "Development", "Investment", "ESG", "Market Analysis"])
+    with col4:
+        sort_by = st.selectbox("Sort by", SORTS)
+    
+    # New filters start again from the first page
+    filters = (name_search, class_filter, specialization_filter, sort_by)
+    if st.session_state.get('directory_filters') != filters:
+        st.session_state.directory_filters = filters
+        st.session_state.directory_page = 1
+    
+    result = directory_page(*filters, st.session_state.get('directory_page', 1), PAGE_SIZE)
+    
+    st.markdown("---")
+    
+    # Member cards, only for the current page
+    for member in result['items']:
+        user_id, user = member['user_id'], member['user']
+        profile, application = member['profile'], member['application']
+        
+        # Display member card
+        with st.container():
+            col1, col2, col3 = st.columns([1, 3, 1])
+            
+            with col1:
+                # Profile picture placeholder
+                st.image(f"https://ui-avatars.com/api/?name={user['first_name']}+{user['last_name']}&background=990000&color=fff&size=100", width=100)
+            
+            with col2:
+                st.markdown(f"### {user['first_name']} {user['last_name']}")
+                
+                if application:
+                    st.caption(f"Class of {application['graduation_year']} • {application['major']}")
+                else:
+                    st.caption("Alumni")
+                
+                st.write((profile.get('bio') or 'No bio available')[:120] + "...")
+                
+                if profile.get('specializations'):
+                    spec_tags = " ".join([f"`{spec}`" for spec in profile['specializations'][:3]])
+                    st.markdown(spec_tags)
+                
+                if member['connections']:
+                    st.caption(f"🤝 {member['connections']} connections")
+            
+            with col3:
+                if st.button("View Profile", key=f"view_profile_{user_id}", use_container_width=True):
+                    st.info(f"Viewing {user['first_name']}'s profile")
+                
+                if user_id != st.session_state.user_id:
+                    if st.button("Connect", key=f"connect_dir_{user_id}", use_container_width=True):
+                        st.success(f"Connection request sent to {user['first_name']}!")
+                    
+                    if st.button("Message", key=f"message_dir_{user_id}", use_container_width=True):
+                        st.info(f"Message window opened for {user['first_name']}")
+            
+            st.markdown("---")
+    
+    if result['total'] == 0:
+        st.info("No members found matching your search criteria.")
+    else:
+        first = (result['page'] - 1) * result['page_size'] + 1
+        last = first + len(result['items']) - 1
+        st.caption(f"Showing {first}-{last} of {result['total']} members")
+        if result['pages'] > 1:
+            # The storage clamps out-of-range pages; keep the widget in step
+            st.session_state.directory_page = result['page']
+            st.number_input(f"Page (of {result['pages']})", min_value=1, max_value=result['pages'],
+                            key="directory_page")
@@ -0,0 +1,53 @@
+"""Events page."""
+import streamlit as st
+
+from portal_data import events, join_event_waitlist, get_waitlist_position, session_storage
+
+def render():
+    storage = session_storage()
+    
+    st.title("Events Calendar")
+    
+    # Event filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        event_type = st.selectbox("Event Type", ["All", "Recruiting", "Networking", "Educational", "Social"])
+    with col2:
+        timeframe = st.selectbox("Timeframe", ["Upcoming", "This Month", "Next Month", "Past Events"])
+    with col3:
+        if st.button("Add to Calendar", use_container_width=True):
+            st.info("Calendar integration coming soon!")
+    
+    # Events list
+    for event in events():
+        with st.expander(f"{event['title']} - {event['event_date'].strftime('%B %d, %Y')}"):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.markdown(f"**Description:** {event['description']}")
+                st.write(f"📅 **Date:** {event['event_date'].strftime('%A, %B %d at %I:%M %p')}")
+                unlimited = event['max_attendees'] is None  # no cap: always open, no progress bar
+                if unlimited:
+                    st.write(f"👥 **Registered:** {event['current_attendees']}")
+                else:
+                    st.write(f"👥 **Registered:** {event['current_attendees']}/{event['max_attendees']}")
+                    
+                    # Progress bar for registration
+                    st.progress(event['current_attendees'] / event['max_attendees'])
+            
+            with col2:
+                if unlimited or event['current_attendees'] < event['max_attendees']:
+                    if st.button("Register", key=f"event_reg_{event['event_id']}"):
+                        if storage.register_for_event(event['event_id'], st.session_state.user_id):
+                            st.success("Successfully registered!")
+                            st.rerun()
+                        else:
+                            st.error("Event Full")
+                else:
+                    st.error("Event Full")
+                    position = get_waitlist_position(event['event_id'], st.session_state.user_id)
+                    if position:
+                        st.caption(f"You're #{position} on the waitlist")
+                    elif st.button("Join Waitlist", key=f"waitlist_{event['event_id']}"):
+                        position = join_event_waitlist(event['event_id'], st.session_state.user_id)
+                        st.info(f"Added to waitlist - you're #{position} in line")
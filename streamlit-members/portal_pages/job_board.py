@@ -0,0 +1,108 @@
+"""Job Board page."""
+import streamlit as st
+
+from job_index import ALL
+from portal_data import job_listing, get_job_applications, session_storage
+
+FILTERS = (("job_type", "Job Type"), ("experience_level", "Experience"),
+           ("location", "Location"), ("company", "Company"))
+
+
+def facet_filter(label: str, counts: dict, key: str) -> str:
+    """Facet dropdown labelled with how many open jobs each option leaves"""
+    options = [ALL, *counts]
+    return st.selectbox(label, options, key=key,
+                        format_func=lambda value: value if value == ALL else f"{value} ({counts[value]})")
+
+
+def status_label(status: str) -> str:
+    return status.replace('_', ' ').title()
+
+
+def render():
+    storage = session_storage()
+    
+    st.title("🎯 Job Board")
+    
+    # Job filters. The selection is read from session state first so the
+    # dropdowns can show counts for it; options that left the index reset to All
+    search = st.text_input("Search jobs", placeholder="Search titles, companies, requirements...")
+    filters = {facet: st.session_state.get(f"job_filter_{facet}", ALL) for facet, _ in FILTERS}
+    listing = job_listing(filters, search)
+    gone = [facet for facet, value in filters.items() if value != ALL and value not in listing['facets'][facet]]
+    if gone:
+        for facet in gone:
+            filters[facet] = st.session_state[f"job_filter_{facet}"] = ALL
+        listing = job_listing(filters, search)
+    
+    columns = st.columns(len(FILTERS))
+    for column, (facet, label) in zip(columns, FILTERS):
+        with column:
+            facet_filter(label, listing['facets'][facet], f"job_filter_{facet}")
+    
+    # My Applications section
+    user_applications = get_job_applications(st.session_state.user_id)
+    applied_jobs = {app['job_id'] for app in user_applications}
+    with st.expander("📋 My Applications", expanded=False):
+        if user_applications:
+            for app in user_applications:
+                col1, col2, col3 = st.columns([3, 2, 1])
+                with col1:
+                    st.write(f"**{app['title']}** at {app['company']}")
+                with col2:
+                    status_color = "🟢" if app['status'] in ("interview_scheduled", "offered") else "🟡"
+                    st.write(f"{status_color} {status_label(app['status'])}")
+                with col3:
+                    st.caption(f"Applied {app['applied_at'].strftime('%m/%d/%y')}")
+                st.markdown("---")
+        else:
+            st.info("No applications yet. Start applying to jobs below!")
+    
+    st.markdown("### Available Positions")
+    
+    # Open job listings, ranked by the search index when searching
+    if not listing['items']:
+        st.info("No open positions match these filters.")
+    
+    for job in listing['items']:
+        with st.container():
+            col1, col2 = st.columns([4, 1])
+            
+            with col1:
+                st.markdown(f"### {job['title']}")
+                st.markdown(f"**{job['company']}** • {job['location']} • {job['job_type']}")
+                st.write(job['description'])
+                
+                # Requirements
+                st.markdown("**Requirements:**")
+                for req in job['requirements']:
+                    st.write(f"• {req}")
+                
+                # Job details
+                col1a, col1b, col1c = st.columns(3)
+                with col1a:
+                    st.caption(f"💰 {job['salary_range']}")
+                with col1b:
+                    st.caption(f"📅 Posted {job['posted_date'].strftime('%B %d, %Y')}")
+                with col1c:
+                    st.caption(f"⏰ Apply by {job['application_deadline'].strftime('%B %d, %Y')}")
+                if job.get('application_count'):
+                    st.caption(f"👥 {job['application_count']} applied")
+            
+            with col2:
+                if job['job_id'] in applied_jobs:
+                    st.button("Applied ✓", key=f"apply_job_{job['job_id']}", disabled=True, use_container_width=True)
+                elif st.button("Apply Now", key=f"apply_job_{job['job_id']}", use_container_width=True):
+                    # Repeat submissions return the existing application, so a double click applies once
+                    if storage.apply_for_job(job['job_id'], st.session_state.user_id) is None:
+                        st.error("Applications for this posting have closed.")
+                    else:
+                        st.success("Application submitted successfully!")
+                        st.balloons()
+                
+                if st.button("Save Job", key=f"save_job_{job['job_id']}", use_container_width=True):
+                    st.info("Job saved to your list")
+                
+                st.button("Share", key=f"share_job_{job['job_id']}", use_container_width=True)
+            
+            st.markdown("---")
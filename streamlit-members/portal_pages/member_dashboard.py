@@ -0,0 +1,80 @@
+"""Member Dashboard page."""
+import streamlit as st
+
+from portal_data import events, resources, job_postings
+
+def render():
+    st.title("Member Dashboard")
+    
+    st.markdown(f"### Welcome, {st.session_state.user_data['first_name']}!")
+    
+    # Member metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Events Attended", "8", "+2 this month")
+    with col2:
+        st.metric("Resources Accessed", "23", "+5 this week")
+    with col3:
+        st.metric("Connections", "15", "+3 new")
+    with col4:
+        st.metric("Profile Views", "47", "+12 this week")
+    
+    st.markdown("---")
+    
+    # Upcoming events
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📅 Upcoming Events")
+        for event in events()[:2]:
+            with st.container():
+                st.markdown(f"**{event['title']}**")
+                st.caption(event['description'][:100] + "...")
+                st.write(f"📍 {event['event_date'].strftime('%B %d at %I:%M %p')}")
+                if st.button(f"Register", key=f"reg_{event['event_id']}"):
+                    st.success("Registered successfully!")
+    
+    with col2:
+        st.subheader("📚 Latest Resources")
+        for resource in resources()[:2]:
+            with st.container():
+                st.markdown(f"**{resource['title']}**")
+                st.caption(resource['description'][:100] + "...")
+                if st.button(f"Download", key=f"dl_{resource['resource_id']}"):
+                    st.info("Download started...")
+    
+    # Recommendations
+    st.markdown("---")
+    st.subheader("🎯 Recommended for You")
+    
+    rec_tabs = st.tabs(["Alumni Mentors", "Job Opportunities", "Learning Paths"])
+    
+    with rec_tabs[0]:
+        st.info("Based on your interest in Investment/REPE, connect with these alumni:")
+        alumni_recs = [
+            {"name": "Oscar Yan", "company": "Blackstone", "role": "VP"},
+            {"name": "Samantha Armendariz", "company": "Hines", "role": "Associate"},
+        ]
+        for alum in alumni_recs:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.write(f"**{alum['name']}** - {alum['role']} at {alum['company']}")
+            with col2:
+                st.button("Connect", key=f"alum_{alum['name']}")
+    
+    with rec_tabs[1]:
+        st.info("New opportunities matching your profile:")
+        for job in job_postings()[:2]:
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.write(f"**{job['title']}** at {job['company']}")
+                st.caption(f"{job['location']} • {job['salary_range']} • Posted {job['posted_date'].strftime('%m/%d')}") 
+            with col2:
+                if st.button("Apply", key=f"apply_{job['job_id']}"):
+                    st.success("Application submitted!")
+    
+    with rec_tabs[2]:
+        st.info("Recommended courses based on your interests:")
+        courses = ["Real Estate Financial Modeling", "Market Analysis Fundamentals", "ARGUS Certification Prep"]
+        for course in courses:
+            st.write(f"• {course}")
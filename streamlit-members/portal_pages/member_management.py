@@ -0,0 +1,64 @@
+"""Member Management page."""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from portal_data import PORTAL_CACHE_TTL_SECONDS, MEMBER_TABLES, members, session_storage
+
+
+@st.cache_data(ttl=PORTAL_CACHE_TTL_SECONDS, show_spinner=False)
+def load_member_table(search: str, status_filter: str, year_filter: str, version) -> pd.DataFrame:
+    """Member Management rows for one combination of filters"""
+    rows = []
+    for member in members():
+        user, app = member['user'], member['application']
+        if not app:
+            continue
+        if search and search.lower() not in f"{user['first_name']} {user['last_name']} {user['email']}".lower():
+            continue
+        if status_filter != "All" and user['status'] != status_filter.lower():
+            continue
+        if year_filter != "All" and str(app['graduation_year']) != year_filter:
+            continue
+        rows.append({
+            "Name": f"{user['first_name']} {user['last_name']}",
+            "Email": user['email'],
+            "Year": app['graduation_year'],
+            "Major": app['major'],
+            "Status": user['status'].title(),
+            "Joined": user['created_at'].strftime('%Y-%m-%d')
+        })
+    return pd.DataFrame(rows)
+
+
+def render():
+    storage = session_storage()
+    
+    st.title("Member Management")
+    
+    # Search and filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        search = st.text_input("Search members", placeholder="Name or email...")
+    with col2:
+        status_filter = st.selectbox("Status", ["All", "Active", "Inactive", "Pending"])
+    with col3:
+        year_filter = st.selectbox("Graduation Year", ["All", "2025", "2026", "2027", "2028"])
+    
+    # Member table
+    df = load_member_table(search, status_filter, year_filter, storage.table_version(*MEMBER_TABLES))
+    
+    if not df.empty:
+        st.dataframe(df, use_container_width=True)
+        
+        # Bulk actions
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("Export to CSV"):
+                st.download_button(
+                    label="Download CSV",
+                    data=df.to_csv(index=False),
+                    file_name=f"trea_members_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv"
+                )
@@ -0,0 +1,168 @@
+"""Networking Hub page."""
+import streamlit as st
+
+from portal_data import public_members, get_inbox_page, get_unread_count, session_storage
+
+def render():
+    storage = session_storage()
+    
+    st.title("🤝 Networking Hub")
+    
+    # Unread messages notification
+    unread_count = get_unread_count(st.session_state.user_id)
+    if unread_count:
+        st.warning(f"You have {unread_count} unread messages!")
+    
+    tab1, tab2, tab3 = st.tabs(["Messages", "My Connections", "Discover Members"])
+    
+    with tab1:
+        st.subheader("💬 Messages")
+        
+        # Message composition
+        with st.expander("✉️ Compose New Message", expanded=False):
+            with st.form("compose_message"):
+                recipients = {
+                    f"{m['user']['first_name']} {m['user']['last_name']}": m['user_id']
+                    for m in public_members() if m['user_id'] != st.session_state.user_id
+                }
+                to_user = st.selectbox("To:", list(recipients))
+                subject = st.text_input("Subject")
+                message_body = st.text_area("Message", height=100)
+                
+                if st.form_submit_button("Send Message"):
+                    if to_user and subject and message_body:
+                        storage.send_message(st.session_state.user_id, recipients[to_user], subject, message_body)
+                        st.success(f"Message sent to {to_user}!")
+                    else:
+                        st.error("Please fill in all fields")
+        
+        # Message inbox, one page at a time; "Load older messages" adds the next page
+        st.markdown("### Inbox")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            unread_only = st.toggle("Unread only", key="inbox_unread_only")
+        with col2:
+            if unread_count and st.button("Mark all as read", key="inbox_mark_all"):
+                storage.mark_messages_read(st.session_state.user_id)
+                st.rerun()
+        
+        if st.session_state.get('inbox_view') != (st.session_state.user_id, unread_only):
+            st.session_state.inbox_view = (st.session_state.user_id, unread_only)
+            st.session_state.inbox_cursors = [None]
+        pages = [get_inbox_page(st.session_state.user_id, cursor, unread_only)
+                 for cursor in st.session_state.inbox_cursors]
+        all_messages = [msg for page in pages for msg in page['items']]
+        
+        if all_messages:
+            users = {m['user_id']: m['user'] for m in public_members()}
+            for msg in all_messages:
+                sender_user = users.get(msg['from_user']) or {}
+                sender = sender_user.get('first_name', 'Unknown')
+                sender_last = sender_user.get('last_name', '')
+                
+                with st.expander(f"{'🔴' if not msg['read'] else '📧'} From {sender} {sender_last}: {msg['subject']}"):
+                    st.write(f"**Sent:** {msg['timestamp'].strftime('%B %d, %Y at %I:%M %p')}")
+                    st.write(msg['message'])
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.button("Reply", key=f"reply_{msg['message_id']}"):
+                            st.info("Reply window opened")
+                    with col2:
+                        if not msg['read'] and st.button("Mark as Read", key=f"read_{msg['message_id']}"):
+                            storage.mark_messages_read(st.session_state.user_id, [msg['message_id']])
+                            st.rerun()
+            
+            if pages[-1]['next_cursor'] is not None and st.button("Load older messages", key="inbox_older"):
+                st.session_state.inbox_cursors.append(pages[-1]['next_cursor'])
+                st.rerun()
+        else:
+            st.info("No unread messages." if unread_only else "No messages yet. Start networking to receive messages!")
+    
+    with tab2:
+        st.subheader("👥 My Connections")
+        
+        # Connection stats
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Connections", "15", "+3 this month")
+        with col2:
+            st.metric("Alumni Mentors", "3", "+1 new")
+        with col3:
+            st.metric("Peer Connections", "12", "+2 this month")
+        
+        # Current connections
+        user_connections = storage.get_connections(st.session_state.user_id)
+        
+        if user_connections:
+            members_by_id = {m['user_id']: m for m in public_members()}
+            for connection_id in user_connections:
+                connection = members_by_id.get(connection_id)
+                connection_user = connection['user'] if connection else None
+                connection_profile = connection['profile'] if connection else None
+                
+                if connection_user and connection_profile:
+                    with st.container():
+                        col1, col2 = st.columns([3, 1])
+                        
+                        with col1:
+                            st.markdown(f"**{connection_user['first_name']} {connection_user['last_name']}**")
+                            st.caption((connection_profile.get('bio') or 'No bio available')[:100] + "...")
+                            
+                            # Show specializations
+                            if connection_profile.get('specializations'):
+                                spec_text = "Specializes in: " + ", ".join(connection_profile['specializations'][:3])
+                                st.write(spec_text)
+                        
+                        with col2:
+                            if st.button("Message", key=f"msg_conn_{connection_id}"):
+                                st.info("Message window opened")
+                            if st.button("View Profile", key=f"view_conn_{connection_id}"):
+                                st.info("Profile opened")
+                        
+                        st.markdown("---")
+        else:
+            st.info("No connections yet. Discover new members in the next tab!")
+    
+    with tab3:
+        st.subheader("🔍 Discover Members")
+        
+        # Search filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            experience_level = st.selectbox("Experience Level", ["All", "Student", "Professional", "Alumni"])
+        with col2:
+            specialization = st.selectbox("Specialization", ["All", "Financial Modeling", "Development", "Investment", "ESG", "Market Analysis"])
+        with col3:
+            graduation_year = st.selectbox("Class Year", ["All", "2024", "2025", "2026", "2027", "Alumni"])
+        
+        # Member recommendations
+        st.markdown("### Recommended Connections")
+        
+        # Show other members (excluding current user)
+        for member in public_members():
+            user_id, user, profile = member['user_id'], member['user'], member['profile']
+            if user_id == st.session_state.user_id:  # Skip current user
+                continue
+                
+            if not profile:
+                continue
+            
+            with st.container():
+                col1, col2 = st.columns([4, 1])
+                
+                with col1:
+                    st.markdown(f"### {user['first_name']} {user['last_name']}")
+                    st.write(profile.get('bio') or 'No bio available')
+                    
+                    if profile.get('specializations'):
+                        st.write("**Specializations:** " + ", ".join(profile['specializations']))
+                
+                with col2:
+                    if st.button("Connect", key=f"connect_{user_id}", use_container_width=True):
+                        st.success(f"Connection request sent to {user['first_name']}!")
+                    
+                    if st.button("View Profile", key=f"view_{user_id}", use_container_width=True):
+                        st.info("Profile opened")
+                
+                st.markdown("---")
@@ -0,0 +1,107 @@
+"""Portfolio page."""
+import streamlit as st
+
+from portal_data import get_user_profile
+
+def render():
+    st.title("📁 My Portfolio")
+    
+    profile = get_user_profile(st.session_state.user_id)
+    
+    # Upload new project
+    with st.expander("➕ Add New Project", expanded=False):
+        with st.form("new_project_form"):
+            project_title = st.text_input("Project Title")
+            project_type = st.selectbox("Project Type", ["Financial Model", "Market Analysis", "Research Paper", "Case Study", "Development Proposal"])
+            project_description = st.text_area("Description", height=100)
+            project_file = st.file_uploader("Upload File", type=['pdf', 'xlsx', 'docx', 'pptx'])
+            project_tags = st.multiselect("Tags", ["DCF", "Market Analysis", "Development", "Investment", "ESG", "Sustainability", "ARGUS", "Research"])
+            
+            if st.form_submit_button("Add Project", use_container_width=True):
+                if project_title and project_description:
+                    st.success(f"Project '{project_title}' added to your portfolio!")
+                else:
+                    st.error("Please fill in all required fields")
+    
+    # Current portfolio projects
+    st.markdown("### My Projects")
+    
+    if profile and 'portfolio_projects' in profile:
+        # Mock detailed project data
+        project_details = {
+            "DCF Model for Mixed-Use Development": {
+                "type": "Financial Model",
+                "description": "Comprehensive DCF analysis for a 200-unit mixed-use development in downtown LA",
+                "date": "January 2024",
+                "tags": ["DCF", "Development", "Mixed-Use"],
+                "views": 47,
+                "downloads": 12
+            },
+            "LA Market Analysis Report": {
+                "type": "Market Analysis", 
+                "description": "Quarterly analysis of Los Angeles commercial real estate market trends and forecasts",
+                "date": "December 2023",
+                "tags": ["Market Analysis", "LA Market", "Research"],
+                "views": 89,
+                "downloads": 25
+            },
+            "Green Building Feasibility Study": {
+                "type": "Research Paper",
+                "description": "Analysis of LEED certification costs vs. long-term benefits for office buildings",
+                "date": "November 2023", 
+                "tags": ["ESG", "Sustainability", "Research"],
+                "views": 63,
+                "downloads": 18
+            },
+            "ESG Investment Framework": {
+                "type": "Case Study",
+                "description": "Framework for integrating ESG metrics into real estate investment decisions",
+                "date": "October 2023",
+                "tags": ["ESG", "Investment", "Framework"],
+                "views": 72,
+                "downloads": 31
+            }
+        }
+        
+        for project_name in profile['portfolio_projects']:
+            if project_name in project_details:
+                details = project_details[project_name]
+                
+                with st.container():
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.markdown(f"### {project_name}")
+                        st.markdown(f"**{details['type']}** • {details['date']}")
+                        st.write(details['description'])
+                        
+                        # Tags
+                        tag_cols = st.columns(len(details['tags']))
+                        for i, tag in enumerate(details['tags']):
+                            with tag_cols[i]:
+                                st.markdown(f"`{tag}`")
+                    
+                    with col2:
+                        st.metric("Views", details['views'])
+                        st.metric("Downloads", details['downloads'])
+                        
+                        if st.button("Edit", key=f"edit_{project_name}"):
+                            st.info("Edit mode activated")
+                        if st.button("Share", key=f"share_proj_{project_name}"):
+                            st.success("Share link copied!")
+                    
+                    st.markdown("---")
+    else:
+        st.info("No projects in your portfolio yet. Add your first project above!")
+    
+    # Portfolio analytics
+    st.markdown("### Portfolio Analytics")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Projects", "4")
+    with col2:
+        st.metric("Total Views", "271", "+15 this week")
+    with col3:
+        st.metric("Total Downloads", "86", "+8 this week")
+    with col4:
+        st.metric("Profile Ranking", "#12", "+3 positions")
@@ -0,0 +1,105 @@
+"""Profile Settings page."""
+import streamlit as st
+
+from portal_data import get_user_profile, session_storage
+
+def render():
+    storage = session_storage()
+    
+    st.title("Profile Settings")
+    
+    tabs = st.tabs(["Profile", "Account", "Notifications", "Privacy"])
+    
+    with tabs[0]:
+        st.subheader("Profile Information")
+        
+        profile = get_user_profile(st.session_state.user_id)
+        
+        with st.form("profile_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                first_name = st.text_input("First Name", value=st.session_state.user_data['first_name'])
+                last_name = st.text_input("Last Name", value=st.session_state.user_data['last_name'])
+                phone = st.text_input("Phone", value=st.session_state.user_data['phone'])
+            
+            with col2:
+                email = st.text_input("Email", value=st.session_state.user_data['email'], disabled=True)
+                linkedin = st.text_input("LinkedIn URL", value=profile['linkedin_url'] if profile else "")
+                
+            bio = st.text_area("Bio", value=profile['bio'] if profile else "", height=100)
+            
+            if profile:
+                specializations = st.multiselect(
+                    "Areas of Expertise",
+                    ["Financial Modeling", "Market Analysis", "Development", "Asset Management", 
+                     "Acquisitions", "Property Management", "Consulting"],
+                    default=profile['specializations']
+                )
+            
+            if st.form_submit_button("Update Profile", use_container_width=True):
+                storage.update_user(st.session_state.user_id, first_name=first_name,
+                                    last_name=last_name, phone=phone)
+                updated_profile = dict(profile or {"user_id": st.session_state.user_id,
+                                                   "specializations": [], "is_public": True})
+                updated_profile.update(linkedin_url=linkedin, bio=bio)
+                if profile:
+                    updated_profile["specializations"] = specializations
+                storage.save_profile(updated_profile)
+                st.session_state.user_data = storage.get_user(st.session_state.user_id)
+                st.success("Profile updated successfully!")
+    
+    with tabs[1]:
+        st.subheader("Account Settings")
+        
+        # Account info
+        st.write(f"**Member Since:** {st.session_state.user_data['created_at'].strftime('%B %Y')}")
+        st.write(f"**Last Login:** {st.session_state.user_data['last_login'].strftime('%B %d, %Y at %I:%M %p')}")
+        st.write(f"**Account Status:** {st.session_state.user_data['status'].title()}")
+        
+        st.markdown("---")
+        
+        # Password change
+        with st.form("password_form"):
+            st.subheader("Change Password")
+            current_password = st.text_input("Current Password", type="password")
+            new_password = st.text_input("New Password", type="password")
+            confirm_password = st.text_input("Confirm New Password", type="password")
+            
+            if st.form_submit_button("Update Password"):
+                if new_password == confirm_password:
+                    st.success("Password updated successfully!")
+                else:
+                    st.error("Passwords do not match")
+    
+    with tabs[2]:
+        st.subheader("Notification Preferences")
+        
+        st.checkbox("Email notifications for new job postings", value=True)
+        st.checkbox("Weekly newsletter", value=True)
+        st.checkbox("Event reminders", value=True)
+        st.checkbox("Alumni connection requests", value=True)
+        st.checkbox("Resource updates", value=False)
+        st.checkbox("System announcements", value=True)
+        
+        if st.button("Save Preferences", use_container_width=True):
+            st.success("Notification preferences updated!")
+    
+    with tabs[3]:
+        st.subheader("Privacy Settings")
+        
+        st.checkbox("Show profile in member directory", value=True)
+        st.checkbox("Allow other members to contact me", value=True)
+        st.checkbox("Show my career interests to alumni", value=True)
+        st.checkbox("Include me in alumni matching", value=True)
+        
+        st.markdown("---")
+        
+        st.subheader("Data Management")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Download My Data", use_container_width=True):
+                st.info("Your data export will be emailed to you within 24 hours")
+        with col2:
+            if st.button("Delete Account", use_container_width=True, type="secondary"):
+                st.warning("Please contact admin@usctrea.com to delete your account")
@@ -0,0 +1,38 @@
+"""Resources page."""
+import streamlit as st
+
+from portal_data import resources, search_content
+
+def render():
+    st.title("Resources Library")
+    
+    # Resource categories
+    category = st.selectbox("Category", ["All", "Market Reports", "Guides", "Templates", "Industry Research"])
+    
+    # Search
+    search = st.text_input("Search resources", placeholder="Search by title or keyword...")
+    
+    resource_list = resources()
+    if search:
+        by_id = {r['resource_id']: r for r in resource_list}
+        resource_list = [by_id[rid] for rid in search_content(search, 'resource') if rid in by_id]
+        if not resource_list:
+            st.info("No resources match your search.")
+    
+    # Resource grid
+    col1, col2 = st.columns(2)
+    
+    for i, resource in enumerate(resource_list):
+        with col1 if i % 2 == 0 else col2:
+            with st.container():
+                st.markdown(f"### {resource['title']}")
+                st.caption(f"Added {resource['created_at'].strftime('%B %d, %Y')}")
+                st.write(resource['description'])
+                
+                if st.session_state.access_level in ['admin', 'member']:
+                    if st.button(f"Access Resource", key=f"resource_{resource['resource_id']}"):
+                        st.success("Resource opened in new tab")
+                else:
+                    st.warning("Premium membership required")
+                
+                st.markdown("---")
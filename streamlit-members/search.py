@@ -0,0 +1,165 @@
+"""Full-text search index for resources, events and job postings.
+
+Documents are (doc_type, doc_id, title, body, access_level) rows. On SQLite
+they live in an FTS5 table ranked with bm25; on Postgres in a table with a
+weighted tsvector column behind a GIN index. Other databases fall back to a
+plain table searched with LIKE.
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+SQLITE_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        doc_type UNINDEXED, doc_id UNINDEXED, access_level UNINDEXED,
+        title, body, tokenize = 'porter unicode61'
+    )
+"""
+
+POSTGRES_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS search_index (
+        doc_type VARCHAR(20) NOT NULL,
+        doc_id INTEGER NOT NULL,
+        access_level VARCHAR(20) NOT NULL,
+        title TEXT NOT NULL,
+        body TEXT NOT NULL,
+        tsv TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A') ||
+            setweight(to_tsvector('english', body), 'B')
+        ) STORED,
+        PRIMARY KEY (doc_type, doc_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_search_index_tsv ON search_index USING GIN (tsv)",
+]
+
+FALLBACK_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS search_index (
+        doc_type VARCHAR(20) NOT NULL,
+        doc_id INTEGER NOT NULL,
+        access_level VARCHAR(20) NOT NULL,
+        title TEXT NOT NULL,
+        body TEXT NOT NULL,
+        PRIMARY KEY (doc_type, doc_id)
+    )
+"""
+
+
+def query_tokens(q: str) -> List[str]:
+    return TOKEN_RE.findall(q.lower())
+
+
+class SearchIndex:
+    def __init__(self):
+        self.backend: Optional[str] = None
+
+    def ensure_schema(self, connection):
+        dialect = connection.dialect.name
+        if dialect == "sqlite":
+            try:
+                connection.execute(text(SQLITE_SCHEMA))
+                self.backend = "fts5"
+                return
+            except OperationalError:
+                # sqlite built without FTS5
+                pass
+        elif dialect == "postgresql":
+            for statement in POSTGRES_SCHEMA:
+                connection.execute(text(statement))
+            self.backend = "tsvector"
+            return
+        connection.execute(text(FALLBACK_SCHEMA))
+        self.backend = "like"
+
+    def upsert(self, connection, doc_type: str, doc_id: int, title: str, body: str,
+               access_level: str = "member"):
+        params = {
+            "doc_type": doc_type, "doc_id": doc_id, "access_level": access_level or "member",
+            "title": title or "", "body": body or "",
+        }
+        if self.backend == "tsvector":
+            connection.execute(text("""
+                INSERT INTO search_index (doc_type, doc_id, access_level, title, body)
+                VALUES (:doc_type, :doc_id, :access_level, :title, :body)
+                ON CONFLICT (doc_type, doc_id) DO UPDATE
+                SET access_level = EXCLUDED.access_level, title = EXCLUDED.title, body = EXCLUDED.body
+            """), params)
+            return
+        self.remove(connection, doc_type, doc_id)
+        connection.execute(text("""
+            INSERT INTO search_index (doc_type, doc_id, access_level, title, body)
+            VALUES (:doc_type, :doc_id, :access_level, :title, :body)
+        """), params)
+
+    def remove(self, connection, doc_type: str, doc_id: int):
+        connection.execute(
+            text("DELETE FROM search_index WHERE doc_type = :doc_type AND doc_id = :doc_id"),
+            {"doc_type": doc_type, "doc_id": doc_id}
+        )
+
+    def clear(self, connection):
+        connection.execute(text("DELETE FROM search_index"))
+
+    def search(self, connection, q: str, doc_types: Sequence[str], access_levels: Sequence[str],
+               limit: int = 20) -> List[Dict[str, Any]]:
+        """Ranked matches; every query token must match, the last one as a prefix"""
+        tokens = query_tokens(q)
+        if not tokens or not doc_types:
+            return []
+
+        params: Dict[str, Any] = {"limit": limit}
+        filters = []
+        for name, values in (("doc_type", doc_types), ("access_level", access_levels)):
+            keys = []
+            for i, value in enumerate(values):
+                params[f"{name}_{i}"] = value
+                keys.append(f":{name}_{i}")
+            filters.append(f"{name} IN ({', '.join(keys)})")
+        where = " AND ".join(filters)
+
+        if self.backend == "fts5":
+            params["match"] = " ".join(f'"{t}"' for t in tokens[:-1]) + f' "{tokens[-1]}"*'
+            sql = f"""
+                SELECT doc_type, doc_id, title,
+                       snippet(search_index, 4, '<b>', '</b>', '...', 12) AS snippet,
+                       bm25(search_index, 0, 0, 0, 10.0, 1.0) AS score
+                FROM search_index
+                WHERE search_index MATCH :match AND {where}
+                ORDER BY score
+                LIMIT :limit
+            """
+        elif self.backend == "tsvector":
+            params["match"] = " & ".join(f"{t}:*" for t in tokens)
+            sql = f"""
+                SELECT doc_type, doc_id, title,
+                       ts_headline('english', body, query, 'MaxFragments=1, MaxWords=12') AS snippet,
+                       -ts_rank(tsv, query) AS score
+                FROM search_index, to_tsquery('english', :match) AS query
+                WHERE tsv @@ query AND {where}
+                ORDER BY score
+                LIMIT :limit
+            """
+        else:
+            likes = []
+            for i, token in enumerate(tokens):
+                params[f"token_{i}"] = f"%{token}%"
+                likes.append(f"(lower(title) LIKE :token_{i} OR lower(body) LIKE :token_{i})")
+            sql = f"""
+                SELECT doc_type, doc_id, title, substr(body, 1, 120) AS snippet, 0 AS score
+                FROM search_index
+                WHERE {' AND '.join(likes)} AND {where}
+                ORDER BY doc_id DESC
+                LIMIT :limit
+            """
+
+        rows = connection.execute(text(sql), params).mappings().all()
+        return [
+            {"type": row["doc_type"], "id": int(row["doc_id"]), "title": row["title"],
+             "snippet": row["snippet"], "score": round(-float(row["score"] or 0), 4)}
+            for row in rows
+        ]
@@ -0,0 +1,518 @@
+"""SQLite/Postgres storage for the portal, on the API's SQLAlchemy models."""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import create_engine, select, update, func, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from dbpool import PoolMonitor, pool_options
+from models import (
+    Base, User, MemberApplication, AlumniCollaboration, MemberProfile, Resource, Event,
+    EventRegistration, EventWaitlistEntry, JobPosting, JobApplication, UserRole, Message, MemberConnection
+)
+from storage import MockDatabase, PortalStorage, sha256_hex
+
+USER_FIELDS = ("email", "password_hash", "first_name", "last_name", "phone", "created_at", "last_login", "status")
+PROFILE_FIELDS = ("user_id", "bio", "linkedin_url", "experience_level", "specializations",
+                  "portfolio_projects", "profile_image_url", "is_public")
+APPLICATION_FIELDS = ("user_id", "graduation_year", "major", "career_interests", "interest_reason",
+                      "experience", "goals", "application_status", "submitted_at", "reviewed_at")
+ROLE_FIELDS = ("user_id", "role_name", "permissions")
+JOB_APPLICATION_FIELDS = ("application_id", "job_id", "user_id", "status", "applied_at", "updated_at")
+# Demo account passwords, so seeded users get bcrypt hashes rather than MockDatabase's sha256 digests
+DEMO_PASSWORDS = ("admin123", "member123", "alumni123", "samantha123")
+
+
+def seed_password_hash(digest: str) -> str:
+    """bcrypt hash for a demo account's sha256 digest; other digests (or no passlib) are kept as is"""
+    password = next((p for p in DEMO_PASSWORDS if sha256_hex(p) == digest), None)
+    if password is None:
+        return digest
+    try:
+        from passlib.context import CryptContext
+    except ImportError:
+        return digest
+    return CryptContext(schemes=["bcrypt"]).hash(password)
+
+
+def as_dict(row, fields) -> Optional[Dict]:
+    if row is None:
+        return None
+    return {field: getattr(row, field) for field in fields}
+
+
+def columns_of(model) -> List[str]:
+    return [column.key for column in model.__table__.columns]
+
+
+# Session-level queries shared with backend_api's portal endpoints
+def member_listing(session, user_fields=USER_FIELDS, user_ids: Optional[Iterable[int]] = None) -> List[Dict]:
+    """Every user (or just user_ids) with their profile, latest application and first role, in one query"""
+    latest_application = (
+        select(func.max(MemberApplication.application_id).label("application_id"))
+        .group_by(MemberApplication.user_id)
+        .subquery()
+    )
+    first_role = (
+        select(func.min(UserRole.role_id).label("role_id"))
+        .group_by(UserRole.user_id)
+        .subquery()
+    )
+    query = (
+        select(User, MemberProfile, MemberApplication, UserRole)
+        .outerjoin(MemberProfile, MemberProfile.user_id == User.user_id)
+        .outerjoin(MemberApplication, (MemberApplication.user_id == User.user_id) &
+                   MemberApplication.application_id.in_(select(latest_application.c.application_id)))
+        .outerjoin(UserRole, (UserRole.user_id == User.user_id) &
+                   UserRole.role_id.in_(select(first_role.c.role_id)))
+        .order_by(User.user_id)
+    )
+    if user_ids is not None:
+        query = query.where(User.user_id.in_(list(user_ids)))
+    return [
+        {
+            "user_id": user.user_id,
+            "user": as_dict(user, user_fields),
+            "profile": as_dict(profile, PROFILE_FIELDS),
+            "application": as_dict(application, APPLICATION_FIELDS),
+            "role": as_dict(role, ROLE_FIELDS),
+        }
+        for user, profile, application, role in session.execute(query)
+    ]
+
+
+def table_listing(session, model, order_by) -> List[Dict]:
+    fields = columns_of(model)
+    return [as_dict(row, fields) for row in session.scalars(select(model).order_by(order_by))]
+
+
+def event_listing(session) -> List[Dict]:
+    """Events with the portal's current_attendees/category names alongside the columns"""
+    events = table_listing(session, Event, Event.event_id)
+    for event in events:
+        event["current_attendees"] = event["registered_count"]
+        event["category"] = event["event_type"]
+    return events
+
+
+# Mailbox: users.unread_message_count moves in the same transaction as sends and reads
+def mailbox_page(session, user_id: int, limit: int = 20, cursor: Optional[int] = None,
+               unread_only: bool = False) -> Dict:
+    """Newest-first page of a user's messages; pass next_cursor back for the page after"""
+    query = select(Message).where(Message.to_user == user_id)
+    if unread_only:
+        query = query.where(Message.read == False)
+    if cursor is not None:
+        query = query.where(Message.message_id < cursor)
+    rows = session.scalars(query.order_by(Message.message_id.desc()).limit(limit + 1)).all()
+    fields = columns_of(Message)
+    items = [as_dict(row, fields) for row in rows[:limit]]
+    return {"items": items, "next_cursor": items[-1]["message_id"] if len(rows) > limit else None}
+
+
+def unread_message_count(session, user_id: int) -> int:
+    return session.scalar(select(User.unread_message_count).where(User.user_id == user_id)) or 0
+
+
+def messages_after(session, user_id: int, after_id: int, limit: int = 100) -> List[Dict]:
+    """The user's messages newer than after_id, oldest first"""
+    rows = session.scalars(
+        select(Message).where(Message.to_user == user_id, Message.message_id > after_id)
+        .order_by(Message.message_id).limit(limit)
+    ).all()
+    fields = columns_of(Message)
+    return [as_dict(row, fields) for row in rows]
+
+
+def deliver_message(session, from_user: int, to_user: int, subject: str, body: str) -> Dict:
+    row = Message(from_user=from_user, to_user=to_user, subject=subject, message=body)
+    session.add(row)
+    session.execute(update(User).where(User.user_id == to_user)
+                    .values(unread_message_count=User.unread_message_count + 1))
+    session.commit()
+    return as_dict(row, columns_of(Message))
+
+
+def mark_read(session, user_id: int, message_ids: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+    """Mark the user's unread messages (all, or just message_ids) read.
+
+    Returns (message_id, from_user) for each message that changed, for read receipts.
+    """
+    if message_ids is not None and not message_ids:
+        return []
+    query = update(Message).where(Message.to_user == user_id, Message.read == False)
+    if message_ids is not None:
+        query = query.where(Message.message_id.in_(message_ids))
+    marked = session.execute(query.values(read=True).returning(Message.message_id, Message.from_user)).all()
+    if marked:
+        session.execute(update(User).where(User.user_id == user_id)
+                        .values(unread_message_count=User.unread_message_count - len(marked)))
+    session.commit()
+    return [tuple(row) for row in marked]
+
+
+def recount_unread(session):
+    """Rebuild every unread counter from the messages table"""
+    unread = (select(func.count()).select_from(Message)
+              .where(Message.to_user == User.user_id, Message.read == False)
+              .scalar_subquery())
+    session.execute(update(User).values(unread_message_count=unread))
+    session.commit()
+
+
+def connection_ids(session, user_id: int) -> List[int]:
+    return list(session.scalars(
+        select(MemberConnection.connected_user_id)
+        .where(MemberConnection.user_id == user_id)
+        .order_by(MemberConnection.connection_id)
+    ))
+
+
+def submit_job_application(session, job_id: int, user_id: int) -> Tuple[Optional[Dict], bool]:
+    """Idempotent apply; commits. (application, created), or (None, False) when the posting
+    is closed, past its deadline or missing"""
+    def existing():
+        return as_dict(session.scalar(select(JobApplication).where(
+            JobApplication.job_id == job_id, JobApplication.user_id == user_id
+        )), JOB_APPLICATION_FIELDS)
+
+    application = existing()
+    if application is not None:
+        return application, False
+    # The counter moves in the same transaction as the insert, and only while the posting is open
+    opened = session.execute(
+        update(JobPosting)
+        .where(JobPosting.job_id == job_id, JobPosting.status == "active",
+               JobPosting.application_deadline.is_(None) | (JobPosting.application_deadline > datetime.now()))
+        .values(application_count=JobPosting.application_count + 1)
+    ).rowcount
+    if not opened:
+        session.rollback()
+        return None, False
+    row = JobApplication(job_id=job_id, user_id=user_id)
+    session.add(row)
+    try:
+        session.commit()
+    except IntegrityError:
+        # A concurrent request (double click) applied first; the rollback undoes this count
+        session.rollback()
+        return existing(), False
+    return as_dict(row, JOB_APPLICATION_FIELDS), True
+
+
+def applications_by_user(session, user_id: int) -> List[Dict]:
+    rows = session.execute(
+        select(JobApplication, JobPosting.title, JobPosting.company)
+        .join(JobPosting, JobPosting.job_id == JobApplication.job_id)
+        .where(JobApplication.user_id == user_id)
+        .order_by(JobApplication.applied_at.desc())
+    )
+    return [{**as_dict(application, JOB_APPLICATION_FIELDS), "title": title, "company": company}
+            for application, title, company in rows]
+
+
+def applications_received(session, poster_id: int) -> List[Dict]:
+    rows = session.execute(
+        select(JobApplication, JobPosting.title, JobPosting.company, User.first_name, User.last_name, User.email)
+        .join(JobPosting, JobPosting.job_id == JobApplication.job_id)
+        .join(User, User.user_id == JobApplication.user_id)
+        .where(JobPosting.posted_by == poster_id)
+        .order_by(JobPosting.job_id, JobApplication.applied_at.desc())
+    )
+    return [
+        {**as_dict(application, JOB_APPLICATION_FIELDS), "title": title, "company": company,
+         "first_name": first_name, "last_name": last_name, "email": email}
+        for application, title, company, first_name, last_name, email in rows
+    ]
+
+
+def connection_count_by_user(session) -> Dict[int, int]:
+    return dict(session.execute(
+        select(MemberConnection.user_id, func.count()).group_by(MemberConnection.user_id)
+    ).all())
+
+
+class SQLStorage(PortalStorage):
+    """One pooled engine per process; every call is a short session"""
+
+    def __init__(self, database_url: str, pool_size: int = 5, max_overflow: int = 10,
+                 seed_demo: bool = True):
+        super().__init__()
+        self.monitor = PoolMonitor("portal")
+        self.engine = create_engine(database_url, **pool_options(
+            database_url, self.monitor, size=pool_size, max_overflow=max_overflow,
+            timeout=30, recycle=1800, pre_ping=True
+        ))
+        self.monitor.attach(self.engine)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        Base.metadata.create_all(self.engine)
+        if seed_demo:
+            self.seed_if_empty(MockDatabase())
+
+    # Demo data
+    def seed_if_empty(self, mock: MockDatabase):
+        with self.Session() as session:
+            if session.scalar(select(func.count()).select_from(User)):
+                return
+            session.add_all(
+                User(user_id=uid, **dict(user, password_hash=seed_password_hash(user["password_hash"])))
+                for uid, user in mock.users.items()
+            )
+            session.flush()
+            session.add_all(UserRole(role_id=rid, **role) for rid, role in mock.user_roles.items())
+            session.add_all(
+                MemberProfile(profile_id=pid, **{k: v for k, v in p.items() if k in PROFILE_FIELDS})
+                for pid, p in mock.member_profiles.items()
+            )
+            session.add_all(
+                MemberApplication(application_id=aid, **{k: v for k, v in a.items() if k in APPLICATION_FIELDS})
+                for aid, a in mock.member_applications.items()
+            )
+            session.add_all(
+                AlumniCollaboration(collaboration_id=cid, user_id=c["user_id"], company=c["company"],
+                                    industry=c["industry"], collaboration_type=c["collaboration_type"],
+                                    position=c["position"])
+                for cid, c in mock.alumni_collaborations.items()
+            )
+            resource_columns = columns_of(Resource)
+            session.add_all(
+                Resource(**{k: v for k, v in r.items() if k in resource_columns}) for r in mock.resources
+            )
+            session.add_all(
+                Event(event_id=e["event_id"], title=e["title"], description=e["description"],
+                      event_date=e["event_date"], event_type=e["category"], location=e["location"],
+                      registration_required=e["registration_required"], max_attendees=e["max_attendees"],
+                      registered_count=e["current_attendees"])
+                for e in mock.events
+            )
+            session.add_all(JobPosting(**job) for job in mock.job_postings)
+            session.flush()
+            session.add_all(JobApplication(**a) for a in mock.job_applications.values())
+            session.add_all(Message(**m) for m in mock.messages)
+            session.add_all(
+                MemberConnection(user_id=uid, connected_user_id=other)
+                for uid, others in mock.member_connections.items() for other in others
+            )
+            session.commit()
+            recount_unread(session)
+            if self.engine.dialect.name == "postgresql":
+                self._advance_sequences(session)
+
+    def _advance_sequences(self, session):
+        """Explicit seed ids don't move Postgres sequences; catch them up"""
+        for table in Base.metadata.sorted_tables:
+            pk = list(table.primary_key.columns)
+            if len(pk) != 1 or not pk[0].autoincrement:
+                continue
+            session.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', '{pk[0].name}'), "
+                f"COALESCE((SELECT MAX({pk[0].name}) FROM {table.name}), 0) + 1, false)"
+            ))
+        session.commit()
+
+    # Users and membership
+    def get_user(self, user_id: int) -> Optional[Dict]:
+        with self.Session() as session:
+            return as_dict(session.get(User, user_id), USER_FIELDS)
+
+    def get_user_id_by_email(self, email: str) -> Optional[int]:
+        email = email.strip()
+        with self.Session() as session:
+            # Exact match uses the email index; fall back to a case-insensitive scan
+            user_id = session.scalar(select(User.user_id).where(User.email == email))
+            if user_id is None:
+                user_id = session.scalar(select(User.user_id).where(func.lower(User.email) == email.lower()))
+            return user_id
+
+    def verify_password(self, user_id: int, password: str) -> bool:
+        with self.Session() as session:
+            password_hash = session.scalar(select(User.password_hash).where(User.user_id == user_id))
+        if not password_hash:
+            return False
+        if password_hash.startswith("$2"):
+            # Accounts registered through the API carry bcrypt hashes
+            try:
+                from passlib.context import CryptContext
+            except ImportError:
+                return False
+            return CryptContext(schemes=["bcrypt"]).verify(password, password_hash)
+        return password_hash == sha256_hex(password)
+
+    def add_user(self, user: Dict) -> int:
+        with self.Session() as session:
+            row = User(**{k: v for k, v in user.items() if k in USER_FIELDS})
+            session.add(row)
+            session.commit()
+        self._touch("users")
+        return row.user_id
+
+    def update_user(self, user_id: int, **changes):
+        with self.Session() as session:
+            session.execute(update(User).where(User.user_id == user_id).values(**changes))
+            session.commit()
+        self._touch("users")
+
+    def get_profile(self, user_id: int) -> Optional[Dict]:
+        with self.Session() as session:
+            row = session.scalar(select(MemberProfile).where(MemberProfile.user_id == user_id))
+            return as_dict(row, PROFILE_FIELDS)
+
+    def get_application(self, user_id: int) -> Optional[Dict]:
+        with self.Session() as session:
+            row = session.scalar(
+                select(MemberApplication).where(MemberApplication.user_id == user_id)
+                .order_by(MemberApplication.application_id.desc()).limit(1)
+            )
+            return as_dict(row, APPLICATION_FIELDS)
+
+    def get_role(self, user_id: int) -> Optional[Dict]:
+        with self.Session() as session:
+            row = session.scalar(
+                select(UserRole).where(UserRole.user_id == user_id).order_by(UserRole.role_id).limit(1)
+            )
+            return as_dict(row, ROLE_FIELDS)
+
+    def _save_one(self, model, key_filter, values: Dict, fields) -> Dict:
+        with self.Session() as session:
+            row = session.scalar(select(model).where(key_filter).limit(1))
+            if row is None:
+                row = model()
+                session.add(row)
+            for field, value in values.items():
+                if field in fields:
+                    setattr(row, field, value)
+            session.commit()
+        self._touch(model.__tablename__)
+        return as_dict(row, fields)
+
+    def save_profile(self, profile: Dict) -> Dict:
+        return self._save_one(MemberProfile, MemberProfile.user_id == profile["user_id"], profile, PROFILE_FIELDS)
+
+    def save_application(self, application: Dict) -> Dict:
+        return self._save_one(MemberApplication, MemberApplication.user_id == application["user_id"],
+                              application, APPLICATION_FIELDS)
+
+    def assign_role(self, user_id: int, role_name: str, permissions: List[str]) -> Dict:
+        return self._save_one(UserRole, UserRole.user_id == user_id,
+                              {"user_id": user_id, "role_name": role_name, "permissions": permissions},
+                              ROLE_FIELDS)
+
+    def list_members(self) -> List[Dict]:
+        with self.Session() as session:
+            return member_listing(session)
+
+    def count_alumni_collaborations(self) -> int:
+        with self.Session() as session:
+            return session.scalar(select(func.count()).select_from(AlumniCollaboration))
+
+    def collaboration_types(self, user_id: int) -> List[str]:
+        with self.Session() as session:
+            return list(session.scalars(select(AlumniCollaboration.collaboration_type).where(
+                AlumniCollaboration.user_id == user_id, AlumniCollaboration.is_active == True
+            )))
+
+    # Content
+    def list_resources(self) -> List[Dict]:
+        with self.Session() as session:
+            return table_listing(session, Resource, Resource.resource_id)
+
+    def list_events(self) -> List[Dict]:
+        with self.Session() as session:
+            return event_listing(session)
+
+    def list_job_postings(self) -> List[Dict]:
+        with self.Session() as session:
+            return table_listing(session, JobPosting, JobPosting.job_id)
+
+    # Job applications
+    def apply_for_job(self, job_id: int, user_id: int) -> Optional[Dict]:
+        with self.Session() as session:
+            application, _ = submit_job_application(session, job_id, user_id)
+        self._touch("job_applications", "job_postings")
+        return application
+
+    def get_job_applications(self, user_id: int) -> List[Dict]:
+        with self.Session() as session:
+            return applications_by_user(session, user_id)
+
+    def get_received_applications(self, poster_id: int) -> List[Dict]:
+        with self.Session() as session:
+            return applications_received(session, poster_id)
+
+    # Messaging and networking
+    def inbox_page(self, user_id: int, limit: int = 20, cursor: Optional[int] = None,
+                   unread_only: bool = False) -> Dict:
+        with self.Session() as session:
+            return mailbox_page(session, user_id, limit, cursor, unread_only)
+
+    def unread_count(self, user_id: int) -> int:
+        with self.Session() as session:
+            return unread_message_count(session, user_id)
+
+    def send_message(self, from_user: int, to_user: int, subject: str, body: str) -> int:
+        with self.Session() as session:
+            message = deliver_message(session, from_user, to_user, subject, body)
+        self._touch("messages")
+        return message["message_id"]
+
+    def mark_messages_read(self, user_id: int, message_ids: Optional[List[int]] = None) -> int:
+        with self.Session() as session:
+            marked = mark_read(session, user_id, message_ids)
+        self._touch("messages")
+        return len(marked)
+
+    def get_connections(self, user_id: int) -> List[int]:
+        with self.Session() as session:
+            return connection_ids(session, user_id)
+
+    def connection_counts(self) -> Dict[int, int]:
+        with self.Session() as session:
+            return connection_count_by_user(session)
+
+    # Event registration and waitlists
+    def register_for_event(self, event_id: int, user_id: int) -> bool:
+        with self.Session() as session:
+            # Guarded increment: only succeeds while seats remain
+            claimed = session.execute(
+                update(Event)
+                .where(Event.event_id == event_id,
+                       (Event.max_attendees.is_(None)) | (Event.registered_count < Event.max_attendees))
+                .values(registered_count=Event.registered_count + 1)
+            ).rowcount
+            if not claimed:
+                return False
+            session.add(EventRegistration(event_id=event_id, user_id=user_id))
+            try:
+                session.commit()
+            except IntegrityError:
+                # Already registered; the rollback returns the seat
+                session.rollback()
+        self._touch("events")
+        return True
+
+    def waitlist_position(self, event_id: int, user_id: int) -> Optional[int]:
+        with self.Session() as session:
+            ticket = session.scalar(select(EventWaitlistEntry.ticket).where(
+                EventWaitlistEntry.event_id == event_id, EventWaitlistEntry.user_id == user_id
+            ))
+            if ticket is None:
+                return None
+            return session.scalar(select(func.count()).select_from(EventWaitlistEntry).where(
+                EventWaitlistEntry.event_id == event_id, EventWaitlistEntry.ticket <= ticket
+            ))
+
+    def join_waitlist(self, event_id: int, user_id: int) -> int:
+        with self.Session() as session:
+            # Bumping the event's ticket counter also serializes concurrent joins
+            session.execute(update(Event).where(Event.event_id == event_id)
+                            .values(waitlist_seq=Event.waitlist_seq + 1))
+            ticket = session.scalar(select(Event.waitlist_seq).where(Event.event_id == event_id))
+            session.add(EventWaitlistEntry(event_id=event_id, user_id=user_id, ticket=ticket))
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+        self._touch("event_waitlist")
+        return self.waitlist_position(event_id, user_id)
+
@@ -0,0 +1,797 @@
+"""Storage backends for the Streamlit portal.
+
+``InMemoryStorage`` serves the bundled demo data from ``MockDatabase``;
+``sql_storage.SQLStorage`` keeps the same data in SQLite/Postgres using the
+API's SQLAlchemy models; ``api_storage.APIStorage`` calls backend_api over
+HTTP. Pages only talk to the ``PortalStorage`` interface.
+"""
+import bisect
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from content_search import ContentSearchIndex
+from job_index import accepting_applications
+from member_directory import ALL, DEFAULT_PAGE_SIZE, DirectoryIndex, public_member
+from member_matching import InterestIndex, rank_matches
+
+# Tables the directory index is built from
+DIRECTORY_TABLES = ("users", "member_profiles", "member_applications", "user_roles", "member_connections")
+# Tables the content search index is built from
+SEARCH_TABLES = ("resources", "events", "job_postings")
+
+
+# Mock database following the provided schema
+class MockDatabase:
+    def __init__(self):
+        # Users table
+        self.users = {
+            1: {
+                "email": "admin@usc.edu",
+                "password_hash": hashlib.sha256("admin123".encode()).hexdigest(),
+                "first_name": "Kyle",
+                "last_name": "Tran",
+                "phone": "213-555-0001",
+                "created_at": datetime(2023, 1, 1),
+                "last_login": datetime.now(),
+                "status": "active"
+            },
+            2: {
+                "email": "member@usc.edu",
+                "password_hash": hashlib.sha256("member123".encode()).hexdigest(),
+                "first_name": "Sophia",
+                "last_name": "Lee",
+                "phone": "213-555-0002",
+                "created_at": datetime(2023, 9, 1),
+                "last_login": datetime.now(),
+                "status": "active"
+            },
+            3: {
+                "email": "alumni@company.com",
+                "password_hash": hashlib.sha256("alumni123".encode()).hexdigest(),
+                "first_name": "Oscar",
+                "last_name": "Yan",
+                "phone": "213-555-0003",
+                "created_at": datetime(2019, 5, 15),
+                "last_login": datetime.now(),
+                "status": "active"
+            },
+            4: {
+                "email": "samantha@usc.edu",
+                "password_hash": hashlib.sha256("samantha123".encode()).hexdigest(),
+                "first_name": "Samantha",
+                "last_name": "Armendariz",
+                "phone": "213-555-0004",
+                "created_at": datetime(2023, 8, 15),
+                "last_login": datetime.now(),
+                "status": "active"
+            }
+        }
+        
+        # Member applications
+        self.member_applications = {
+            1: {
+                "user_id": 2,
+                "graduation_year": 2025,
+                "major": "Business Administration",
+                "career_interests": ["Investment/REPE", "Development"],
+                "application_status": "approved",
+                "gpa": 3.8,
+                "experience": "Summer analyst at JLL"
+            },
+            2: {
+                "user_id": 4,
+                "graduation_year": 2026,
+                "major": "Real Estate Development",
+                "career_interests": ["Development", "Asset Management"],
+                "application_status": "approved",
+                "gpa": 3.9,
+                "experience": "Intern at CBRE"
+            }
+        }
+        
+        # Alumni collaborations
+        self.alumni_collaborations = {
+            1: {
+                "user_id": 3,
+                "company": "Blackstone",
+                "industry": "Private Equity",
+                "collaboration_type": "mentorship",
+                "position": "Vice President",
+                "years_experience": 8
+            }
+        }
+        
+        # User roles
+        self.user_roles = {
+            1: {"user_id": 1, "role_name": "admin", "permissions": ["all"]},
+            2: {"user_id": 2, "role_name": "member", "permissions": ["read", "create_own"]},
+            3: {"user_id": 3, "role_name": "alumni", "permissions": ["read", "collaborate"]},
+            4: {"user_id": 4, "role_name": "member", "permissions": ["read", "create_own"]}
+        }
+        
+        # Member profiles
+        self.member_profiles = {
+            1: {
+                "user_id": 2,
+                "bio": "Real estate enthusiast focused on investment analysis and financial modeling",
+                "linkedin_url": "https://linkedin.com/in/sophialee",
+                "experience_level": "student",
+                "specializations": ["Financial Modeling", "Market Analysis"],
+                "portfolio_projects": ["DCF Model for Mixed-Use Development", "LA Market Analysis Report"]
+            },
+            2: {
+                "user_id": 3,
+                "bio": "Vice President at Blackstone Real Estate with 8 years experience in acquisitions and development",
+                "linkedin_url": "https://linkedin.com/in/oscaryan",
+                "experience_level": "professional",
+                "specializations": ["Acquisitions", "Asset Management", "Development"],
+                "portfolio_projects": ["$500M Mixed-Use Acquisition", "Downtown LA Development"]
+            },
+            3: {
+                "user_id": 4,
+                "bio": "Passionate about sustainable development and ESG investing in real estate",
+                "linkedin_url": "https://linkedin.com/in/samanthaarmendariz",
+                "experience_level": "student",
+                "specializations": ["Sustainable Development", "ESG Investing", "Development"],
+                "portfolio_projects": ["Green Building Feasibility Study", "ESG Investment Framework"]
+            }
+        }
+        
+        # Resources
+        self.resources = [
+            {
+                "resource_id": 1,
+                "title": "Real Estate Financial Modeling Guide",
+                "description": "Comprehensive guide to DCF analysis and property valuation",
+                "file_url": "#",
+                "access_level": "member",
+                "created_by": 1,
+                "created_at": datetime(2024, 1, 15)
+            },
+            {
+                "resource_id": 2,
+                "title": "Q4 2023 LA Market Report",
+                "description": "Detailed analysis of Los Angeles commercial real estate trends",
+                "file_url": "#",
+                "access_level": "member",
+                "created_by": 1,
+                "created_at": datetime(2024, 1, 10)
+            }
+        ]
+        
+        # Events
+        self.events = [
+            {
+                "event_id": 1,
+                "title": "CBRE Campus Recruiting",
+                "description": "Meet with CBRE recruiters for summer internship opportunities",
+                "event_date": datetime.now() + timedelta(days=7),
+                "registration_required": True,
+                "max_attendees": 50,
+                "current_attendees": 32,
+                "location": "USC Marshall School",
+                "category": "Recruiting"
+            },
+            {
+                "event_id": 2,
+                "title": "Real Estate Private Equity Panel",
+                "description": "Industry leaders discuss careers in REPE",
+                "event_date": datetime.now() + timedelta(days=14),
+                "registration_required": True,
+                "max_attendees": 100,
+                "current_attendees": 67,
+                "location": "Virtual Event",
+                "category": "Educational"
+            },
+            {
+                "event_id": 3,
+                "title": "LA Market Deep Dive with Oscar Yan",
+                "description": "Alumni Oscar Yan shares insights on LA commercial real estate trends",
+                "event_date": datetime.now() + timedelta(days=21),
+                "registration_required": True,
+                "max_attendees": 75,
+                "current_attendees": 45,
+                "location": "Downtown LA",
+                "category": "Networking"
+            }
+        ]
+        
+        # Event registrations: event_id -> registered user_ids (seeded attendees are counts only)
+        self.event_registrations = {}
+        
+        # Event waitlists: event_id -> user_ids in join order
+        self.event_waitlists = {}
+        
+        # Job postings
+        self.job_postings = [
+            {
+                "job_id": 1,
+                "title": "Investment Analyst Intern",
+                "company": "Blackstone Real Estate",
+                "location": "Los Angeles, CA",
+                "job_type": "Internship",
+                "experience_level": "Entry Level",
+                "description": "Support investment team with underwriting and due diligence",
+                "requirements": ["Finance or Real Estate major", "Excel proficiency", "3.5+ GPA"],
+                "salary_range": "$25-30/hour",
+                "posted_by": 3,
+                "posted_date": datetime.now() - timedelta(days=3),
+                "application_deadline": datetime.now() + timedelta(days=14),
+                "status": "active",
+                "application_count": 1
+            },
+            {
+                "job_id": 2,
+                "title": "Development Associate",
+                "company": "Related Companies",
+                "location": "Los Angeles, CA",
+                "job_type": "Full-time",
+                "experience_level": "Entry Level",
+                "description": "Join our development team focusing on mixed-use projects",
+                "requirements": ["Real Estate or related degree", "ARGUS knowledge preferred", "Strong analytical skills"],
+                "salary_range": "$75,000-85,000",
+                "posted_by": 1,
+                "posted_date": datetime.now() - timedelta(days=5),
+                "application_deadline": datetime.now() + timedelta(days=21),
+                "status": "active",
+                "application_count": 1
+            },
+            {
+                "job_id": 3,
+                "title": "ESG Research Analyst",
+                "company": "Hines",
+                "location": "Los Angeles, CA",
+                "job_type": "Full-time",
+                "experience_level": "Entry Level",
+                "description": "Focus on sustainable development and ESG metrics for real estate portfolio",
+                "requirements": ["Environmental Studies or Finance background", "Passion for sustainability", "Research experience"],
+                "salary_range": "$70,000-80,000",
+                "posted_by": 1,
+                "posted_date": datetime.now() - timedelta(days=1),
+                "application_deadline": datetime.now() + timedelta(days=30),
+                "status": "active",
+                "application_count": 0
+            }
+        ]
+        
+        # Job applications (one per user and posting); postings carry the counts
+        self.job_applications = {
+            1: {
+                "application_id": 1,
+                "job_id": 1,
+                "user_id": 2,
+                "status": "under_review",
+                "applied_at": datetime.now() - timedelta(days=5),
+                "updated_at": datetime.now() - timedelta(days=2)
+            },
+            2: {
+                "application_id": 2,
+                "job_id": 2,
+                "user_id": 2,
+                "status": "interview_scheduled",
+                "applied_at": datetime.now() - timedelta(days=8),
+                "updated_at": datetime.now() - timedelta(days=1)
+            }
+        }
+        
+        # Member connections/networking
+        self.member_connections = {
+            2: [4],  # Sophia is connected to Samantha
+            4: [2]   # Samantha is connected to Sophia
+        }
+        
+        # Messages between members
+        self.messages = [
+            {
+                "message_id": 1,
+                "from_user": 2,
+                "to_user": 4,
+                "subject": "ESG Project Collaboration",
+                "message": "Hi Samantha! I saw your portfolio project on ESG frameworks. Would love to collaborate on my next analysis.",
+                "timestamp": datetime.now() - timedelta(hours=2),
+                "read": False
+            }
+        ]
+
+
+class PortalStorage:
+    """Everything the portal pages read or write. Rows are plain dicts.
+
+    Each write bumps a per-table version; cached reads are keyed by the
+    versions of the tables they touch.
+    """
+
+    # Rebuild the directory and search indexes at least this often, for writes made by other processes
+    index_ttl = 60.0
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._versions_lock = threading.Lock()
+        self._directory: Optional[Tuple[Tuple, float, DirectoryIndex]] = None
+        self._directory_lock = threading.Lock()
+        self._search: Optional[Tuple[Tuple, float, ContentSearchIndex]] = None
+        self._search_lock = threading.Lock()
+
+    def table_version(self, *tables: str) -> Tuple[int, ...]:
+        with self._versions_lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def _touch(self, *tables: str):
+        with self._versions_lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    # Sessions
+    def authenticate(self, email: str, password: str) -> Optional[Dict]:
+        """{'user_id', 'token'} for valid credentials, recording the login; local backends have no token"""
+        user_id = self.get_user_id_by_email(email)
+        if user_id is None or not self.verify_password(user_id, password):
+            return None
+        self.update_user(user_id, last_login=datetime.now())
+        return {"user_id": user_id, "token": None}
+
+    def for_session(self, token: Optional[str]) -> "PortalStorage":
+        """View of this storage acting for one signed-in session"""
+        return self
+
+    def session_expired(self) -> bool:
+        return False
+
+    # Users and membership
+    def get_user(self, user_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_user_id_by_email(self, email: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def verify_password(self, user_id: int, password: str) -> bool:
+        raise NotImplementedError
+
+    def add_user(self, user: Dict) -> int:
+        raise NotImplementedError
+
+    def update_user(self, user_id: int, **changes):
+        raise NotImplementedError
+
+    def get_profile(self, user_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_application(self, user_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_role(self, user_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def save_profile(self, profile: Dict) -> Dict:
+        raise NotImplementedError
+
+    def save_application(self, application: Dict) -> Dict:
+        raise NotImplementedError
+
+    def assign_role(self, user_id: int, role_name: str, permissions: List[str]) -> Dict:
+        raise NotImplementedError
+
+    def list_members(self) -> List[Dict]:
+        """Every user as {user_id, user, profile, application, role}, in user_id order"""
+        raise NotImplementedError
+
+    def list_public_members(self) -> List[Dict]:
+        """Every user as another member may see them (member_directory.public_member), in user_id order"""
+        return [public_member(member) for member in self.list_members()]
+
+    def count_alumni_collaborations(self) -> int:
+        raise NotImplementedError
+
+    def collaboration_types(self, user_id: int) -> List[str]:
+        """Collaboration types of the user's active alumni offers"""
+        raise NotImplementedError
+
+    # Alumni matching, scored the same way as backend_api's /api/alumni/matches
+    def match_members(self, alumni_id: int, collaboration_type: str = "mentorship") -> List[Dict]:
+        """Approved members sharing a career interest with the alum's specializations, as
+        public member rows with match_score and common_interests, best first"""
+        if collaboration_type not in self.collaboration_types(alumni_id):
+            return []
+        members = {m['user_id']: m for m in self.list_members()}
+        index = InterestIndex(
+            (user_id, m['application'].get('career_interests'))
+            for user_id, m in members.items()
+            if m['application'] and m['application'].get('application_status') == 'approved'
+        )
+        specializations = (self.get_profile(alumni_id) or {}).get('specializations')
+        return [
+            {**public_member(members[match['member_id']]),
+             'match_score': match['match_score'], 'common_interests': match['common_interests']}
+            for match in rank_matches(index, [(alumni_id, specializations)])
+        ]
+
+    # Member Directory
+    def directory_index(self) -> DirectoryIndex:
+        version = self.table_version(*DIRECTORY_TABLES)
+        with self._directory_lock:
+            if (self._directory is None or self._directory[0] != version
+                    or time.monotonic() - self._directory[1] > self.index_ttl):
+                self._directory = (version, time.monotonic(),
+                                   DirectoryIndex(self.list_members(), self.connection_counts()))
+            return self._directory[2]
+
+    def directory_page(self, name_search: str = "", class_year: str = ALL, specialization: str = ALL,
+                       sort_by: str = "Name", page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """One sorted page of directory members: {'items', 'total', 'page', 'pages', 'page_size'}"""
+        return self.directory_index().query(name_search, class_year, specialization, sort_by, page, page_size)
+
+    # Content
+    def list_resources(self) -> List[Dict]:
+        raise NotImplementedError
+
+    def search_index(self) -> ContentSearchIndex:
+        version = self.table_version(*SEARCH_TABLES)
+        with self._search_lock:
+            if (self._search is None or self._search[0] != version
+                    or time.monotonic() - self._search[1] > self.index_ttl):
+                self._search = (version, time.monotonic(), ContentSearchIndex.build(
+                    self.list_resources(), self.list_events(), self.list_job_postings()
+                ))
+            return self._search[2]
+
+    def search(self, query: str, doc_type: str) -> List[int]:
+        """Ids of resources, events or jobs (doc_type) matching the query, best match first"""
+        return [doc_id for _, doc_id in self.search_index().search(query, doc_type)]
+
+    def list_events(self) -> List[Dict]:
+        raise NotImplementedError
+
+    def list_job_postings(self) -> List[Dict]:
+        raise NotImplementedError
+
+    # Job applications
+    def apply_for_job(self, job_id: int, user_id: int) -> Optional[Dict]:
+        """Apply once per posting; repeat calls return the existing application. None when applications are closed"""
+        raise NotImplementedError
+
+    def get_job_applications(self, user_id: int) -> List[Dict]:
+        """The user's applications, newest first, with each posting's title and company"""
+        raise NotImplementedError
+
+    def get_received_applications(self, poster_id: int) -> List[Dict]:
+        """Applications to poster_id's postings, with each applicant's name and email"""
+        raise NotImplementedError
+
+    # Messaging and networking
+    def inbox_page(self, user_id: int, limit: int = 20, cursor: Optional[int] = None,
+                   unread_only: bool = False) -> Dict:
+        """Newest-first messages to user_id: {'items', 'next_cursor'}; pass next_cursor for older ones"""
+        raise NotImplementedError
+
+    def unread_count(self, user_id: int) -> int:
+        raise NotImplementedError
+
+    def send_message(self, from_user: int, to_user: int, subject: str, body: str) -> int:
+        raise NotImplementedError
+
+    def mark_messages_read(self, user_id: int, message_ids: Optional[List[int]] = None) -> int:
+        """Mark the user's unread messages read (all of them when message_ids is None); returns how many"""
+        raise NotImplementedError
+
+    def get_connections(self, user_id: int) -> List[int]:
+        raise NotImplementedError
+
+    def connection_counts(self) -> Dict[int, int]:
+        """user_id -> number of connections, for users with any"""
+        raise NotImplementedError
+
+    # Event registration and waitlists
+    def register_for_event(self, event_id: int, user_id: int) -> bool:
+        """Take a seat if one is left; False when the event is full"""
+        raise NotImplementedError
+
+    def join_waitlist(self, event_id: int, user_id: int) -> int:
+        """Add user to an event's waitlist (idempotent) and return their 1-based position"""
+        raise NotImplementedError
+
+    def waitlist_position(self, event_id: int, user_id: int) -> Optional[int]:
+        raise NotImplementedError
+
+
+def sha256_hex(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+class InMemoryStorage(PortalStorage):
+    """MockDatabase access with secondary indexes kept current on every write"""
+
+    def __init__(self, database: Optional[MockDatabase] = None):
+        super().__init__()
+        self.db = database or MockDatabase()
+        self.user_id_by_email: Dict[str, int] = {}
+        self.profile_by_user: Dict[int, Dict] = {}
+        self.application_by_user: Dict[int, Dict] = {}
+        self.role_by_user: Dict[int, Dict] = {}
+        self.job_by_id: Dict[int, Dict] = {}
+        self.job_application_by_key: Dict[Tuple[int, int], Dict] = {}
+        self.job_applications_by_user: Dict[int, List[Dict]] = {}
+        self.job_applications_by_job: Dict[int, List[Dict]] = {}
+        # Per-recipient inboxes in message_id order, plus each recipient's unread messages
+        self.inbox_ids_by_user: Dict[int, List[int]] = {}
+        self.inbox_by_user: Dict[int, List[Dict]] = {}
+        self.unread_by_user: Dict[int, Dict[int, Dict]] = {}
+        self.last_message_id = 0
+        # Next free id per table, taken under _write_lock (sessions share this storage)
+        self.last_ids: Dict[str, int] = {}
+        self._apply_lock = threading.Lock()
+        self._mailbox_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self):
+        self.user_id_by_email = {u['email'].lower(): uid for uid, u in self.db.users.items()}
+        self.profile_by_user = {p['user_id']: p for p in self.db.member_profiles.values()}
+        self.application_by_user = {a['user_id']: a for a in self.db.member_applications.values()}
+        self.role_by_user = {r['user_id']: r for r in self.db.user_roles.values()}
+        self.job_by_id = {j['job_id']: j for j in self.db.job_postings}
+        self.job_application_by_key, self.job_applications_by_user, self.job_applications_by_job = {}, {}, {}
+        for application in self.db.job_applications.values():
+            self._index_job_application(application)
+        self.inbox_ids_by_user, self.inbox_by_user, self.unread_by_user = {}, {}, {}
+        for message in sorted(self.db.messages, key=lambda m: m['message_id']):
+            self._index_message(message)
+        self.last_message_id = max((m['message_id'] for m in self.db.messages), default=0)
+        self.last_ids = {
+            table: max(getattr(self.db, table), default=0)
+            for table in ("users", "member_profiles", "member_applications", "user_roles")
+        }
+
+    def _next_id(self, table: str) -> int:
+        """Allocate an id for a new row; caller holds _write_lock"""
+        self.last_ids[table] += 1
+        return self.last_ids[table]
+
+    def _index_message(self, message: Dict):
+        self.inbox_ids_by_user.setdefault(message['to_user'], []).append(message['message_id'])
+        self.inbox_by_user.setdefault(message['to_user'], []).append(message)
+        if not message['read']:
+            self.unread_by_user.setdefault(message['to_user'], {})[message['message_id']] = message
+
+    def _index_job_application(self, application: Dict):
+        self.job_application_by_key[(application['job_id'], application['user_id'])] = application
+        self.job_applications_by_user.setdefault(application['user_id'], []).append(application)
+        self.job_applications_by_job.setdefault(application['job_id'], []).append(application)
+
+    # Reads
+    def get_user(self, user_id: int) -> Optional[Dict]:
+        return self.db.users.get(user_id)
+
+    def get_user_id_by_email(self, email: str) -> Optional[int]:
+        return self.user_id_by_email.get(email.strip().lower())
+
+    def verify_password(self, user_id: int, password: str) -> bool:
+        user = self.db.users.get(user_id)
+        return user is not None and user['password_hash'] == sha256_hex(password)
+
+    def get_profile(self, user_id: int) -> Optional[Dict]:
+        return self.profile_by_user.get(user_id)
+
+    def get_application(self, user_id: int) -> Optional[Dict]:
+        return self.application_by_user.get(user_id)
+
+    def get_role(self, user_id: int) -> Optional[Dict]:
+        return self.role_by_user.get(user_id)
+
+    def list_members(self) -> List[Dict]:
+        return [
+            {
+                'user_id': user_id,
+                'user': user,
+                'profile': self.profile_by_user.get(user_id),
+                'application': self.application_by_user.get(user_id),
+                'role': self.role_by_user.get(user_id),
+            }
+            for user_id, user in sorted(self.db.users.items())
+        ]
+
+    def count_alumni_collaborations(self) -> int:
+        return len(self.db.alumni_collaborations)
+
+    def collaboration_types(self, user_id: int) -> List[str]:
+        return [c['collaboration_type'] for c in self.db.alumni_collaborations.values()
+                if c['user_id'] == user_id and c.get('is_active', True)]
+
+    def list_resources(self) -> List[Dict]:
+        return self.db.resources
+
+    def list_events(self) -> List[Dict]:
+        return self.db.events
+
+    def list_job_postings(self) -> List[Dict]:
+        return self.db.job_postings
+
+    def get_job_applications(self, user_id: int) -> List[Dict]:
+        applications = sorted(self.job_applications_by_user.get(user_id, []),
+                              key=lambda a: a['applied_at'], reverse=True)
+        return [
+            {**a, 'title': self.job_by_id[a['job_id']]['title'], 'company': self.job_by_id[a['job_id']]['company']}
+            for a in applications
+        ]
+
+    def get_received_applications(self, poster_id: int) -> List[Dict]:
+        received = []
+        for job in self.db.job_postings:
+            if job['posted_by'] != poster_id:
+                continue
+            for application in sorted(self.job_applications_by_job.get(job['job_id'], []),
+                                      key=lambda a: a['applied_at'], reverse=True):
+                applicant = self.db.users[application['user_id']]
+                received.append({
+                    **application, 'title': job['title'], 'company': job['company'],
+                    'first_name': applicant['first_name'], 'last_name': applicant['last_name'],
+                    'email': applicant['email'],
+                })
+        return received
+
+    def inbox_page(self, user_id: int, limit: int = 20, cursor: Optional[int] = None,
+                   unread_only: bool = False) -> Dict:
+        with self._mailbox_lock:
+            if unread_only:
+                unread = self.unread_by_user.get(user_id, {})
+                ids, messages = list(unread), list(unread.values())
+            else:
+                ids, messages = self.inbox_ids_by_user.get(user_id, []), self.inbox_by_user.get(user_id, [])
+            end = len(ids) if cursor is None else bisect.bisect_left(ids, cursor)
+            start = max(0, end - limit)
+            items = messages[start:end][::-1]
+        return {"items": items, "next_cursor": items[-1]['message_id'] if start > 0 else None}
+
+    def unread_count(self, user_id: int) -> int:
+        return len(self.unread_by_user.get(user_id, ()))
+
+    def get_connections(self, user_id: int) -> List[int]:
+        return self.db.member_connections.get(user_id, [])
+
+    def connection_counts(self) -> Dict[int, int]:
+        return {uid: len(ids) for uid, ids in self.db.member_connections.items()}
+
+    def waitlist_position(self, event_id: int, user_id: int) -> Optional[int]:
+        waitlist = self.db.event_waitlists.get(event_id, [])
+        return waitlist.index(user_id) + 1 if user_id in waitlist else None
+
+    # Writes
+    def add_user(self, user: Dict) -> int:
+        with self._write_lock:
+            user_id = self._next_id("users")
+            self.db.users[user_id] = user
+            self.user_id_by_email[user['email'].lower()] = user_id
+        self._touch("users")
+        return user_id
+
+    def update_user(self, user_id: int, **changes):
+        with self._write_lock:
+            user = self.db.users[user_id]
+            if 'email' in changes and changes['email'].lower() != user['email'].lower():
+                self.user_id_by_email.pop(user['email'].lower(), None)
+                self.user_id_by_email[changes['email'].lower()] = user_id
+            user.update(changes)
+        self._touch("users")
+
+    def save_profile(self, profile: Dict) -> Dict:
+        with self._write_lock:
+            existing = self.profile_by_user.get(profile['user_id'])
+            if existing is not None:
+                existing.update(profile)
+            else:
+                self.db.member_profiles[self._next_id("member_profiles")] = profile
+                self.profile_by_user[profile['user_id']] = existing = profile
+        self._touch("member_profiles")
+        return existing
+
+    def save_application(self, application: Dict) -> Dict:
+        with self._write_lock:
+            existing = self.application_by_user.get(application['user_id'])
+            if existing is not None:
+                existing.update(application)
+            else:
+                self.db.member_applications[self._next_id("member_applications")] = application
+                self.application_by_user[application['user_id']] = existing = application
+        self._touch("member_applications")
+        return existing
+
+    def assign_role(self, user_id: int, role_name: str, permissions: List[str]) -> Dict:
+        with self._write_lock:
+            role = self.role_by_user.get(user_id)
+            if role is not None:
+                role.update(role_name=role_name, permissions=permissions)
+            else:
+                role = {"user_id": user_id, "role_name": role_name, "permissions": permissions}
+                self.db.user_roles[self._next_id("user_roles")] = role
+                self.role_by_user[user_id] = role
+        self._touch("user_roles")
+        return role
+
+    def apply_for_job(self, job_id: int, user_id: int) -> Optional[Dict]:
+        with self._apply_lock:
+            existing = self.job_application_by_key.get((job_id, user_id))
+            if existing is not None:
+                return existing
+            job = self.job_by_id.get(job_id)
+            if job is None or not accepting_applications(job):
+                return None
+            application_id = max(self.db.job_applications, default=0) + 1
+            application = {
+                "application_id": application_id, "job_id": job_id, "user_id": user_id,
+                "status": "submitted", "applied_at": datetime.now(), "updated_at": datetime.now()
+            }
+            self.db.job_applications[application_id] = application
+            self._index_job_application(application)
+            job['application_count'] = job.get('application_count', 0) + 1
+        self._touch("job_applications", "job_postings")
+        return application
+
+    def send_message(self, from_user: int, to_user: int, subject: str, body: str) -> int:
+        with self._mailbox_lock:
+            self.last_message_id += 1
+            message_id = self.last_message_id
+            message = {
+                "message_id": message_id, "from_user": from_user, "to_user": to_user,
+                "subject": subject, "message": body, "timestamp": datetime.now(), "read": False
+            }
+            self.db.messages.append(message)
+            self._index_message(message)
+        self._touch("messages")
+        return message_id
+
+    def mark_messages_read(self, user_id: int, message_ids: Optional[List[int]] = None) -> int:
+        with self._mailbox_lock:
+            unread = self.unread_by_user.get(user_id, {})
+            ids = list(unread) if message_ids is None else [i for i in dict.fromkeys(message_ids) if i in unread]
+            for message_id in ids:
+                unread.pop(message_id)['read'] = True
+        self._touch("messages")
+        return len(ids)
+
+    def register_for_event(self, event_id: int, user_id: int) -> bool:
+        """Take a seat; registering again is a no-op that reports success"""
+        with self._write_lock:
+            event = next((e for e in self.db.events if e['event_id'] == event_id), None)
+            if event is None:
+                return False
+            registrants = self.db.event_registrations.setdefault(event_id, set())
+            if user_id in registrants:
+                return True
+            if event['max_attendees'] is not None and event['current_attendees'] >= event['max_attendees']:
+                return False
+            registrants.add(user_id)
+            event['current_attendees'] += 1
+        self._touch("events")
+        return True
+
+    def join_waitlist(self, event_id: int, user_id: int) -> int:
+        with self._write_lock:
+            waitlist = self.db.event_waitlists.setdefault(event_id, [])
+            joined = user_id not in waitlist
+            if joined:
+                waitlist.append(user_id)
+            position = waitlist.index(user_id) + 1
+        if joined:
+            self._touch("event_waitlist")
+        return position
+
+
+def create_storage(kind: str = "memory", database_url: Optional[str] = None,
+                   pool_size: int = 5, max_overflow: int = 10, api_url: Optional[str] = None,
+                   api_cache_ttl: float = 5.0, api_timeout: float = 10.0) -> PortalStorage:
+    """Build the configured backend; SQL needs SQLAlchemy installed, API needs httpx"""
+    if kind == "memory":
+        return InMemoryStorage()
+    if kind == "sql":
+        from sql_storage import SQLStorage
+        return SQLStorage(database_url or "sqlite:///portal.db", pool_size=pool_size, max_overflow=max_overflow)
+    if kind == "api":
+        from api_storage import APIStorage
+        from backend_client import BackendClient
+        return APIStorage(BackendClient(
+            api_url or "http://localhost:8000", max_keepalive=pool_size,
+            max_connections=pool_size + max_overflow, cache_ttl=api_cache_ttl, timeout=api_timeout
+        ))
+    raise ValueError(f"Unknown portal storage '{kind}' (expected 'memory', 'sql' or 'api')")